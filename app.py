@@ -12,9 +12,10 @@ from tkinter.font import Font
 import os
 import sys
 import multiprocessing
-from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait as wait_futures
+from itertools import filterfalse
 
-from key_press import listen_keys, cleanup_hotkeys, reload_hotkeys
 from managers.favorites_manager import FavoritesManager
 from managers.filter_sort_manager import AdvancedFilterSortManager
 from managers.filter_sort_ui import FilterSortUI
@@ -22,8 +23,9 @@ from managers.grid_view_manager import GridViewManager
 from managers.resource_manager import ThreadSafeDict, get_resource_manager, ManagedExecutor, MemoryMonitor, \
     ManagedThread
 from theme import ThemeSelector
-from utils import gather_videos_with_directories, is_video, gather_videos
-from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
+from utils import gather_videos, gather_videos_with_directories, is_video, existing_files, list_tree_entries, \
+    build_path_trie, path_in_trie, list_subtree, init_scan_worker, ScanCancelled, is_skipped_dir, \
+    SCAN_CANCEL_SLOTS
 from managers.playlist_manager import PlaylistManager
 from managers.watch_history_manager import WatchHistoryManager
 from managers.resume_playback_manager import ResumePlaybackManager
@@ -43,6 +45,15 @@ except ImportError:
     VoiceCommandManager = None
 
 
+CONSOLE_MAX_LINES = 1000
+CONSOLE_TRIM_SLACK = 500
+DIR_SELECT_DEBOUNCE_MS = 100
+VIDEO_COUNT_DEBOUNCE_MS = 200
+SCAN_PENDING_SUFFIX = "  (scanning…)"
+# Tree rows are at most 20 folders deep, plus one level for the videos inside.
+INDENTS = tuple("  " * level for level in range(22))
+
+
 def select_multiple_folders_and_play():
     port_file = os.path.expanduser("~/.rmp_instance_port")
 
@@ -82,15 +93,21 @@ def select_multiple_folders_and_play():
         def __init__(self, root):
             super().__init__()
             self.root = root
+            self._console_queue = deque()
+            self._console_flush_scheduled = False
             self.selected_dirs = []
+            self._selected_set = set()
             self.excluded_subdirs = {}
             self.excluded_videos = {}
+            self._exclusion_cache = {}
+            self._exclusion_generation = 0
+            self._exclusion_lock = threading.Lock()
+            self._last_play = None
             self._is_filtered_mode = False
             self._filtered_videos = []
             self._base_directory = None
             self.controller = None
             self.player_thread = None
-            self.keys_thread = None
             self.video_count = 0
             self.current_selected_dir_index = None
             self.current_subdirs_mapping = {}
@@ -103,6 +120,13 @@ def select_multiple_folders_and_play():
             self.search_query = ""
             self.expanded_paths = set()
             self.collapsed_paths = set()
+            self._last_subdir_key = None
+            self._last_subdir_mapping = None
+            self._last_subdir_listed = ()
+            self._select_after_id = None
+            self._count_after_id = None
+            self._playlist_cache = {}
+            self._display_names = {}
             self.current_max_depth = 20
             self.loop_mode = "loop_on"
             self._sleep_timer_job = None
@@ -192,8 +216,25 @@ def select_multiple_folders_and_play():
             self.scan_cache = ThreadSafeDict()
             self.pending_scans = set()
             self._pending_scans_lock = threading.RLock()
+            self._scan_futures = {}
+            self._scan_mtimes = {}
+            # Per root: mtimes of the folders a finished scan depends on, for
+            # deciding at the next start whether the saved scan is still valid.
+            self._scan_tree_mtimes = {}
+            self._restore_persisted_scans()
             max_workers = min(8, (os.cpu_count() or 4))
-            self.executor = ManagedExecutor(ProcessPoolExecutor, max_workers=max_workers)
+            self._scan_cancel = multiprocessing.Event()
+            # One byte per running scan, read by the workers without a lock;
+            # remove_directory sets a scan's byte to stop that walk alone.
+            self._scan_cancel_slots = multiprocessing.RawArray('b', SCAN_CANCEL_SLOTS)
+            self._free_cancel_slots = list(range(SCAN_CANCEL_SLOTS))
+            self._scan_slots = {}
+            self.executor = ManagedExecutor(ProcessPoolExecutor, max_workers=max_workers,
+                                            initializer=init_scan_worker,
+                                            initargs=(self._scan_cancel, self._scan_cancel_slots))
+            # Long-lived pool for short UI-triggered jobs (collecting videos,
+            # starting a player) so a click submits a task instead of spawning a thread.
+            self.task_executor = ManagedExecutor(ThreadPoolExecutor, max_workers=4, thread_name_prefix="DirSelTask")
             self.resource_manager = get_resource_manager()
             self.resource_manager.register_cleanup_callback(self._cleanup_scan_cache)
             self.resource_manager.register_cleanup_callback(self._cleanup_player_threads)
@@ -212,35 +253,19 @@ def select_multiple_folders_and_play():
                     self.selected_dirs.append(command_line_dir)
 
                 for directory in self.selected_dirs:
-                    display_name = directory
-                    if len(directory) > 60:
-                        display_name = os.path.basename(directory)
-                        parent = os.path.dirname(directory)
-                        if parent:
-                            display_name = f"{os.path.basename(parent)}/{display_name}"
-                        display_name = f".../{display_name}"
-                    self.dir_listbox.insert(tk.END, display_name)
-                    self._submit_scan(directory)
+                    self._insert_dir_row(directory)
             elif self.save_directories:
                 self.selected_dirs = preferences.get('selected_dirs', [])
                 for directory in self.selected_dirs:
-                    display_name = directory
-                    if len(directory) > 60:
-                        display_name = os.path.basename(directory)
-                        parent = os.path.dirname(directory)
-                        if parent:
-                            display_name = f"{os.path.basename(parent)}/{display_name}"
-                        display_name = f".../{display_name}"
-                    self.dir_listbox.insert(tk.END, display_name)
-                    self._submit_scan(directory)
+                    self._insert_dir_row(directory)
             else:
                 self.selected_dirs = []
+            # Mirrors selected_dirs for O(1) duplicate checks; kept in step on add/remove.
+            self._selected_set = set(self.selected_dirs)
 
             self.settings_manager = SettingsManager(self.root, self, self.update_console, enable_ai=True)
             self.settings_manager.add_settings_changed_callback(self._on_settings_changed)
-            self.settings_manager.set_hotkey_reload_callback(
-                lambda hk: reload_hotkeys(self.controller, hk)
-            )
+            self.settings_manager.set_hotkey_reload_callback(self._reload_hotkeys)
             app_settings = self.settings_manager.get_settings()
 
             self.video_preview_manager = VideoPreviewManager(self.root, self.update_console)
@@ -400,6 +425,12 @@ def select_multiple_folders_and_play():
                     self.scan_cache.clear()
                 if hasattr(self, 'pending_scans'):
                     self.pending_scans.clear()
+                if hasattr(self, '_scan_futures'):
+                    self._scan_futures.clear()
+                if hasattr(self, '_scan_mtimes'):
+                    self._scan_mtimes.clear()
+                if hasattr(self, '_scan_tree_mtimes'):
+                    self._scan_tree_mtimes.clear()
             except Exception as e:
                 print(f"Error cleaning scan cache: {e}")
 
@@ -414,13 +445,6 @@ def select_multiple_folders_and_play():
                             self.player_thread.join(timeout=2.0)
                     except Exception:
                         pass
-
-                if hasattr(self, 'keys_thread') and self.keys_thread:
-                    try:
-                        if self.keys_thread.is_alive():
-                            self.keys_thread.join(timeout=1.0)
-                    except Exception:
-                        pass
             except Exception as e:
                 print(f"Error cleaning player threads: {e}")
 
@@ -436,6 +460,7 @@ def select_multiple_folders_and_play():
         def _refresh_tree_after_fav_change(self):
             selected_dir = self.get_current_selected_directory()
             if selected_dir:
+                self._last_subdir_key = None
                 scroll_pos = self.exclusion_listbox.yview()
                 self.load_subdirectories(selected_dir, max_depth=self.current_max_depth, restore_scroll=scroll_pos)
 
@@ -452,17 +477,10 @@ def select_multiple_folders_and_play():
                 }
 
         def _add_directory_from_ipc(self, directory):
-            if directory not in self.selected_dirs:
+            if directory not in self._selected_set:
                 self.selected_dirs.append(directory)
-                display_name = directory
-                if len(directory) > 60:
-                    display_name = os.path.basename(directory)
-                    parent = os.path.dirname(directory)
-                    if parent:
-                        display_name = f"{os.path.basename(parent)}/{display_name}"
-                    display_name = f".../{display_name}"
-                self.dir_listbox.insert(tk.END, display_name)
-                self._submit_scan(directory)
+                self._selected_set.add(directory)
+                self._insert_dir_row(directory)
                 self.update_video_count()
                 self.save_preferences()
 
@@ -540,6 +558,8 @@ def select_multiple_folders_and_play():
             self.normal_font = Font(family="Segoe UI", size=10)
             self.small_font = Font(family="Segoe UI", size=9)
             self.mono_font = Font(family="Consolas", size=9)
+            self.large_button_font = Font(family="Segoe UI", size=12, weight="bold")
+            self.small_bold_font = Font(family="Segoe UI", size=9, weight="bold")
 
         def create_custom_buttons(self):
             self.button_variants = {
@@ -569,8 +589,7 @@ def select_multiple_folders_and_play():
                     use_font = self.small_font
                     padx, pady = 8, 3
                 elif size == "lg":
-                    use_font = Font(family=self.normal_font.actual().get("family", "Segoe UI"),
-                                    size=self.normal_font.actual().get("size", 10) + 2, weight="bold")
+                    use_font = self.large_button_font
                     padx, pady = 12, 7
                 else:
                     use_font = self.normal_font
@@ -677,15 +696,31 @@ def select_multiple_folders_and_play():
             self.update_console("Select directories and click 'Play Videos' to start")
 
         def update_console(self, message):
-            def _update():
-                self.console_text.config(state=tk.NORMAL)
-                timestamp = datetime.now().strftime("%H:%M:%S")
-                formatted_message = f"[{timestamp}] {message}\n"
-                self.console_text.insert(tk.END, formatted_message)
-                self.console_text.see(tk.END)
-                self.console_text.config(state=tk.DISABLED)
-
-            self.root.after(0, _update)
+            self._console_queue.append((datetime.now().strftime("%H:%M:%S"), message))
+            # Queue first, then check: a flush that already cleared the flag is
+            # guaranteed to see this message or a newly scheduled flush will.
+            if not self._console_flush_scheduled:
+                self._console_flush_scheduled = True
+                self.root.after(50, self._flush_console)
+
+        def _flush_console(self):
+            self._console_flush_scheduled = False
+            queued = self._console_queue
+            messages = []
+            # deque.popleft is atomic, so producers can keep appending meanwhile.
+            while queued:
+                timestamp, message = queued.popleft()
+                messages.append(f"[{timestamp}] {message}\n")
+            if not messages:
+                return
+            self.console_text.config(state=tk.NORMAL)
+            self.console_text.insert(tk.END, "".join(messages))
+            # Keep a rolling window so long sessions don't slow every insert.
+            line_count = int(self.console_text.index('end-1c').split('.')[0])
+            if line_count > CONSOLE_MAX_LINES + CONSOLE_TRIM_SLACK:
+                self.console_text.delete('1.0', f'end-{CONSOLE_MAX_LINES}l')
+            self.console_text.see(tk.END)
+            self.console_text.config(state=tk.DISABLED)
 
         def clear_console(self):
             self.console_text.config(state=tk.NORMAL)
@@ -700,23 +735,99 @@ def select_multiple_folders_and_play():
                 self.console_section.pack_forget()
             self.save_preferences()
 
+        def _dir_mtime(self, directory):
+            try:
+                return os.stat(directory).st_mtime_ns
+            except OSError:
+                return None
+
+        def invalidate_dir_cache(self, path=None):
+            """Drop cached scan results for path, or for every directory when path is None."""
+            self._last_subdir_key = None
+            if path is None:
+                self.scan_cache.clear()
+                self._scan_mtimes.clear()
+                self._scan_tree_mtimes.clear()
+                self._playlist_cache.clear()
+            else:
+                self.scan_cache.pop(path, None)
+                self._scan_mtimes.pop(path, None)
+                self._scan_tree_mtimes.pop(path, None)
+                self._playlist_cache.pop(path, None)
+
+        def _dir_display_name(self, directory):
+            display_name = self._display_names.get(directory)
+            if display_name is None:
+                display_name = directory
+                if len(directory) > 60:
+                    # One split yields both parts; basename/dirname would each
+                    # split the path again.
+                    parent, display_name = os.path.split(directory)
+                    if parent:
+                        display_name = f"{os.path.basename(parent)}/{display_name}"
+                    display_name = f".../{display_name}"
+                self._display_names[directory] = display_name
+            return display_name
+
+        def _insert_dir_row(self, directory):
+            display_name = self._dir_display_name(directory)
+            # The row carries a marker while its scan runs; on_done clears it.
+            if self._submit_scan(directory) is not None:
+                display_name += SCAN_PENDING_SUFFIX
+            self.dir_listbox.insert(tk.END, display_name)
+
+        def _mark_dir_scanned(self, directory):
+            try:
+                i = self.selected_dirs.index(directory)
+            except ValueError:
+                return
+            text = self.dir_listbox.get(i)
+            if not text.endswith(SCAN_PENDING_SUFFIX):
+                return
+            was_selected = self.dir_listbox.selection_includes(i)
+            self.dir_listbox.delete(i)
+            self.dir_listbox.insert(i, text[:-len(SCAN_PENDING_SUFFIX)])
+            if was_selected:
+                self.dir_listbox.selection_set(i)
+
         def _submit_scan(self, directory):
+            mtime = self._dir_mtime(directory)
             cache_result = self.scan_cache.get(directory)
             if cache_result is not None:
-                return
+                # A changed root mtime means entries were added, removed or renamed
+                # directly under it, so the cached walk is stale.
+                if self._scan_mtimes.get(directory) == mtime:
+                    return None
+                self.invalidate_dir_cache(directory)
 
             with self._pending_scans_lock:
-                if directory in self.pending_scans:
-                    return
+                future = self._scan_futures.get(directory)
+                if future is not None:
+                    return future
                 self.pending_scans.add(directory)
-
-            future = self.executor.submit(gather_videos_with_directories, directory)
-
-            def on_done(fut, dir_path=directory):
+                self._scan_mtimes[directory] = mtime
+                started = time.time_ns()
+                slot = self._free_cancel_slots.pop() if self._free_cancel_slots else None
+                if slot is not None:
+                    self._scan_cancel_slots[slot] = 0
+                    self._scan_slots[directory] = slot
+                future = self.executor.submit(gather_videos_with_directories, directory, None, slot)
+                self._scan_futures[directory] = future
+
+            def on_done(fut, dir_path=directory, slot=slot, started=started):
                 try:
+                    # remove_directory drops the future and flags its slot, so a
+                    # walk already running stops early and its result is discarded.
+                    if self._scan_futures.get(dir_path) is not fut:
+                        return
                     res = fut.result()
                     self.scan_cache.set(dir_path, res)
                     videos, _, directories = res
+                    tree_mtimes = self._tree_mtimes(dir_path, directories, started)
+                    if tree_mtimes is None:
+                        self._scan_tree_mtimes.pop(dir_path, None)
+                    else:
+                        self._scan_tree_mtimes[dir_path] = tree_mtimes
                     self.update_console(
                         f"Found {len(videos)} videos in '{os.path.basename(dir_path)}' ({len(directories)} subdirs)")
 
@@ -732,17 +843,86 @@ def select_multiple_folders_and_play():
                                 else None
                             )
                         )
+                except ScanCancelled:
+                    pass
                 except Exception as e:
                     self.update_console(f"Error scanning {dir_path}: {e}")
                 finally:
                     with self._pending_scans_lock:
-                        self.pending_scans.discard(dir_path)
+                        if self._scan_futures.get(dir_path) is fut:
+                            self.pending_scans.discard(dir_path)
+                            del self._scan_futures[dir_path]
+                            self._scan_slots.pop(dir_path, None)
+                        # The worker is done with the slot whether the walk
+                        # finished, failed or was cancelled.
+                        if slot is not None:
+                            self._free_cancel_slots.append(slot)
                     try:
                         self.root.after(0, self.update_video_count)
+                        self.root.after(0, self._mark_dir_scanned, dir_path)
                     except:
                         pass
 
             future.add_done_callback(on_done)
+            return future
+
+        def _tree_mtimes(self, root, directories, started):
+            # The root, every folder holding videos and the folders between
+            # them: adding, removing or renaming anything a scan found changes
+            # one of these mtimes. A folder that had no videos anywhere below it
+            # is not tracked, so videos added there only show up on Refresh.
+            tracked = {root}
+            for directory in directories:
+                while directory not in tracked and len(directory) > len(root):
+                    tracked.add(directory)
+                    directory = os.path.dirname(directory)
+            mtimes = {}
+            for directory in tracked:
+                mtime = self._dir_mtime(directory)
+                # Changed after the walk began, so the result may already be stale.
+                if mtime is None or mtime >= started:
+                    return None
+                mtimes[directory] = mtime
+            return mtimes
+
+        def _restore_persisted_scans(self):
+            # Reopening the same library uses the saved scan, without walking
+            # it again, while every folder it depends on has its saved mtime.
+            for directory, entry in self.config.load_scan_cache().items():
+                try:
+                    mtimes = entry['mtimes']
+                    videos = entry['videos']
+                    directories = entry['directories']
+                except (TypeError, KeyError):
+                    continue
+                if not isinstance(mtimes, dict) or directory not in mtimes:
+                    continue
+                if any(self._dir_mtime(path) != mtime for path, mtime in mtimes.items()):
+                    continue
+                video_to_dir = {video: os.path.dirname(video) for video in videos}
+                self.scan_cache.set(directory, (videos, video_to_dir, directories))
+                self._scan_mtimes[directory] = mtimes[directory]
+                self._scan_tree_mtimes[directory] = mtimes
+
+        def _persist_scans(self):
+            entries = {}
+            for directory in self.selected_dirs:
+                scan = self.scan_cache.get(directory)
+                mtimes = self._scan_tree_mtimes.get(directory)
+                if scan and mtimes:
+                    videos, _, directories = scan
+                    entries[directory] = {'mtimes': mtimes, 'videos': videos, 'directories': directories}
+            self.config.save_scan_cache(entries)
+
+        def _get_scan(self, directory):
+            # Callers run on the Tk thread after _wait_for_scans_then, so this
+            # only reads the cache. A miss (the scan failed or was cancelled)
+            # restarts or reuses the pool's walk and reports None for now rather
+            # than walking here and freezing the window.
+            cache = self.scan_cache.get(directory)
+            if cache is None:
+                self._submit_scan(directory)
+            return cache
 
         def setup_directory_section(self):
             self.dir_section = tk.Frame(self.content_frame, bg=self.bg_color)
@@ -1123,70 +1303,93 @@ def select_multiple_folders_and_play():
             context_menu = tk.Menu(self.root, tearoff=0)
             context_menu.add_command(label="Play Selected", command=self._play_selected_main_dirs)
             context_menu.add_command(label="Open in Grid View", command=self._open_grid_view_main_dirs)
+            context_menu.add_command(label="Refresh", command=self._refresh_selected_main_dirs)
             context_menu.add_separator()
             context_menu.add_command(label="Remove Selected", command=self.remove_directory)
 
             context_menu.post(event.x_root, event.y_root)
 
-        def _play_selected_main_dirs(self):
+        def _refresh_selected_main_dirs(self):
             selection = self.dir_listbox.curselection()
             if not selection:
                 return
 
-            all_videos = []
+            list_tree_entries.cache_clear()
             for i in selection:
                 if i < len(self.selected_dirs):
-                    root_dir = self.selected_dirs[i]
-                    cache = self.scan_cache.get(root_dir)
-                    if cache:
-                        videos, _, _ = cache
-                        filtered_videos = [
-                            v for v in videos
-                            if not self.is_video_excluded(root_dir, v)
-                        ]
-                    else:
-                        videos = gather_videos(root_dir)
-                        filtered_videos = [
-                            v for v in videos
-                            if not self.is_video_excluded(root_dir, v)
-                        ]
-                    all_videos.extend(filtered_videos)
-
-            if not all_videos:
-                messagebox.showinfo("Information", "No videos found in selected directories.")
+                    directory = self.selected_dirs[i]
+                    self.invalidate_dir_cache(directory)
+                    self._display_names.pop(directory, None)
+                    self.update_console(f"Rescanning '{os.path.basename(directory)}' for videos...")
+                    self._submit_scan(directory)
+
+            self.update_video_count()
+            selected_dir = self.get_current_selected_directory()
+            if selected_dir:
+                self.load_subdirectories(selected_dir, max_depth=getattr(self, 'current_max_depth', 20),
+                                         restore_scroll=self.exclusion_listbox.yview())
+
+        def _play_selected_main_dirs(self):
+            selection = self.dir_listbox.curselection()
+            if not selection:
                 return
 
-            self._play_grid_videos(all_videos)
+            selected_dirs = [self.selected_dirs[i] for i in selection if i < len(self.selected_dirs)]
+
+            def _play():
+                all_videos = self._filtered_main_dir_videos(selected_dirs)
+                if not all_videos:
+                    messagebox.showinfo("Information", "No videos found in selected directories.")
+                    return
+                self._play_grid_videos(all_videos)
+
+            self._wait_for_scans_then(selected_dirs, _play)
 
         def _open_grid_view_main_dirs(self):
             selection = self.dir_listbox.curselection()
             if not selection:
                 return
 
+            selected_dirs = [self.selected_dirs[i] for i in selection if i < len(self.selected_dirs)]
+
+            def _open():
+                all_videos = self._filtered_main_dir_videos(selected_dirs)
+                if not all_videos:
+                    messagebox.showinfo("Information", "No videos found in selected directories.")
+                    return
+                self._open_grid_view(all_videos)
+
+            self._wait_for_scans_then(selected_dirs, _open)
+
+        def _filtered_main_dir_videos(self, selected_dirs):
             all_videos = []
-            for i in selection:
-                if i < len(self.selected_dirs):
-                    root_dir = self.selected_dirs[i]
-                    cache = self.scan_cache.get(root_dir)
-                    if cache:
-                        videos, _, _ = cache
-                        filtered_videos = [
-                            v for v in videos
-                            if not self.is_video_excluded(root_dir, v)
-                        ]
-                    else:
-                        videos = gather_videos(root_dir)
-                        filtered_videos = [
-                            v for v in videos
-                            if not self.is_video_excluded(root_dir, v)
-                        ]
-                    all_videos.extend(filtered_videos)
-
-            if not all_videos:
-                messagebox.showinfo("Information", "No videos found in selected directories.")
-                return
+            for root_dir in selected_dirs:
+                videos = self._playlist_videos(root_dir, self._get_scan(root_dir))
+                if videos:
+                    all_videos.extend(videos)
+            return all_videos
 
-            self._open_grid_view(all_videos)
+        def _wait_for_scans_then(self, directories, callback):
+            # Start any scan that is neither cached nor running, then join them
+            # all on a worker so the Tk loop never performs the walk itself.
+            futures = {}
+            for d in directories:
+                future = self._submit_scan(d)
+                if future is not None:
+                    futures[d] = future
+
+            def _wait():
+                if futures:
+                    # No timeout: returning early would send the callback to
+                    # _get_scan while those walks are still running.
+                    wait_futures(futures.values())
+                    # The done-callback may not have stored the result yet.
+                    for d, fut in futures.items():
+                        if fut.done() and not fut.cancelled() and fut.exception() is None:
+                            self.scan_cache.set(d, fut.result())
+                self.root.after(0, callback)
+
+            ManagedThread(target=_wait, name="WaitForScans").start()
 
         def _on_left_click(self, event):
             index = self.exclusion_listbox.nearest(event.y)
@@ -1423,12 +1626,9 @@ def select_multiple_folders_and_play():
                     if not self.is_video_excluded(selected_dir, item_path):
                         selected_videos.append(item_path)
                 elif item_path and os.path.isdir(item_path):
-                    for root, dirs, files in os.walk(item_path):
-                        for file in files:
-                            full_path = os.path.join(root, file)
-                            if is_video(full_path):
-                                if not self.is_video_excluded(selected_dir, full_path):
-                                    selected_videos.append(full_path)
+                    # Excluded subtrees hold no videos to add, so they are not walked.
+                    _, videos = list_subtree(os.path.normpath(item_path), self._exclusion_sets(selected_dir)[1])
+                    selected_videos.extend(v for v in videos if not self.is_video_excluded(selected_dir, v))
 
             if selected_videos:
                 count = self.favorites_manager.add_to_favorites(selected_videos, selected_dir)
@@ -1449,6 +1649,7 @@ def select_multiple_folders_and_play():
                     selected_videos.append(item_path)
                 elif item_path and os.path.isdir(item_path):
                     for root, dirs, files in os.walk(item_path):
+                        dirs[:] = [d for d in dirs if not is_skipped_dir(d)]
                         for file in files:
                             full_path = os.path.join(root, file)
                             if is_video(full_path):
@@ -1474,10 +1675,11 @@ def select_multiple_folders_and_play():
                 # cleanup_hotkeys()
 
             all_video_to_dir = {v: os.path.dirname(v) for v in videos}
-            all_directories = sorted(list(set(all_video_to_dir.values())))
+            all_directories = sorted(set(all_video_to_dir.values()))
 
             self.update_console(f"Playing {len(videos)} videos from favorites")
 
+            from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
             self.controller = VLCPlayerControllerForMultipleDirectory(
                 videos, all_video_to_dir, all_directories, self.update_console,
                 volume=self.volume, is_muted=self.is_muted
@@ -1502,8 +1704,7 @@ def select_multiple_folders_and_play():
             self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
             self.player_thread.start()
 
-            self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None), daemon=True)
-            self.keys_thread.start()
+            self._start_hotkeys()
 
             def init_overlay_delayed(ctrl=self.controller):
                 time.sleep(1)
@@ -1567,12 +1768,9 @@ def select_multiple_folders_and_play():
                     if not self.is_video_excluded(selected_dir, item_path):
                         selected_videos.append(item_path)
                 elif item_path and os.path.isdir(item_path):
-                    for root, dirs, files in os.walk(item_path):
-                        for file in files:
-                            full_path = os.path.join(root, file)
-                            if is_video(full_path):
-                                if not self.is_video_excluded(selected_dir, full_path):
-                                    selected_videos.append(full_path)
+                    # Excluded subtrees hold no videos to add, so they are not walked.
+                    _, videos = list_subtree(os.path.normpath(item_path), self._exclusion_sets(selected_dir)[1])
+                    selected_videos.extend(v for v in videos if not self.is_video_excluded(selected_dir, v))
 
             if selected_videos:
                 self.playlist_manager.add_videos_to_playlist([], selected_videos)
@@ -1673,9 +1871,10 @@ def select_multiple_folders_and_play():
                     else:
                         self.expanded_paths.add(norm_target)
 
-                scroll_pos = listbox.yview()
-                self.load_subdirectories(selected_dir, max_depth=20, restore_path=norm_target,
-                                         restore_scroll=scroll_pos)
+                if not self._toggle_subtree_rows(selected_dir, index, norm_target):
+                    scroll_pos = listbox.yview()
+                    self.load_subdirectories(selected_dir, max_depth=20, restore_path=norm_target,
+                                             restore_scroll=scroll_pos)
                 return "break"
 
             if not os.path.isfile(target_path) or not is_video(target_path):
@@ -1689,6 +1888,83 @@ def select_multiple_folders_and_play():
 
             return "break"
 
+        def _toggle_subtree_rows(self, selected_dir, index, norm_target):
+            # Expanding or collapsing one folder only touches the rows below it,
+            # so splice those in or out instead of rewalking the whole tree.
+            # Returns False when a full reload is needed instead.
+            base = os.path.abspath(selected_dir)
+            if (self.current_max_depth != 20 or norm_target == os.path.normpath(base)
+                    or not hasattr(self, '_subdir_load_lock')):
+                return False
+            target_path = self.current_subdirs_mapping.get(index)
+            if not target_path or os.path.normpath(target_path) != norm_target:
+                return False
+
+            prefix = norm_target + os.sep
+
+            def is_open():
+                if self.expand_all_var.get():
+                    return norm_target not in self.collapsed_paths
+                return norm_target in self.expanded_paths
+
+            def child_rows_end(paths, row):
+                end = row + 1
+                while end < len(paths) and paths[end] and os.path.normpath(paths[end]).startswith(prefix):
+                    end += 1
+                return end
+
+            paths = [self.current_subdirs_mapping.get(i) for i in range(self.exclusion_listbox.size())]
+            end = child_rows_end(paths, index)
+            if end > index + 1:
+                self.exclusion_listbox.delete(index + 1, end - 1)
+                del paths[index + 1:end]
+            self._set_subtree_mapping(paths, index)
+            if not is_open():
+                return True
+
+            with self._subdir_load_lock:
+                token = self._subdir_load_token
+
+            excluded_dir_set = set(self.excluded_subdirs.get(selected_dir, []))
+            excluded_vid_set = set(self.excluded_videos.get(selected_dir, []))
+            show_videos = self.show_videos
+            only_excluded = self.show_only_excluded
+
+            def build_and_post():
+                rows = self._subdir_rows(base, target_path, 20, excluded_dir_set, excluded_vid_set,
+                                         show_videos, only_excluded)
+                # The first row is the folder itself, which is already listed.
+                rows = [row for row in rows if row[0] != target_path]
+
+                def post_rows():
+                    # Other folders may have been toggled meanwhile, so locate the
+                    # target row again rather than trusting the original index.
+                    if self._subdir_load_token is not token or not rows or not is_open():
+                        return
+                    current = [self.current_subdirs_mapping.get(i) for i in range(self.exclusion_listbox.size())]
+                    try:
+                        row = current.index(target_path)
+                    except ValueError:
+                        return
+                    if child_rows_end(current, row) > row + 1:
+                        return
+                    self.exclusion_listbox.insert(row + 1, *(name for _, name in rows))
+                    current[row + 1:row + 1] = [path for path, _ in rows]
+                    self._set_subtree_mapping(current, row)
+
+                self.root.after(0, post_rows)
+
+            ManagedThread(target=build_and_post, name="ExpandSubdir").start()
+            return True
+
+        def _set_subtree_mapping(self, paths, index):
+            self.current_subdirs_mapping = {i: path for i, path in enumerate(paths) if path}
+            self.video_preview_manager.attach_to_listbox(self.exclusion_listbox, self.current_subdirs_mapping)
+            self.exclusion_listbox.selection_clear(0, tk.END)
+            self.exclusion_listbox.selection_set(index)
+            self.exclusion_listbox.activate(index)
+            self._update_tree_now_playing()
+
         def on_search_changed(self, event=None):
             try:
                 new_query = self.search_entry.get().strip().lower()
@@ -1717,6 +1993,7 @@ def select_multiple_folders_and_play():
             if os.path.isdir(path):
                 try:
                     for root, dirs, files in os.walk(path):
+                        dirs[:] = [d for d in dirs if not is_skipped_dir(d)]
                         for d in dirs:
                             if search_query in d.lower():
                                 return True
@@ -1748,92 +2025,113 @@ def select_multiple_folders_and_play():
                 return self.selected_dirs[self.current_selected_dir_index]
             return None
 
+        def _playlist_videos(self, directory, scan=None):
+            """Videos from directory's scan with its exclusions applied, or None while it is still scanning.
+
+            The result is shared between callers and must not be modified.
+            """
+            scan = scan or self.scan_cache.get(directory)
+            if not scan:
+                return None
+            generation = self._exclusion_generation
+            cached = self._playlist_cache.get(directory)
+            if cached and cached[0] == generation and cached[1] is scan:
+                return cached[2]
+            videos = scan[0]
+            if self.excluded_subdirs.get(directory) or self.excluded_videos.get(directory):
+                is_excluded = self._exclusion_filter(directory)
+                videos = [v for v in videos if not is_excluded(v)]
+            self._playlist_cache[directory] = (generation, scan, videos)
+            return videos
+
         def get_all_videos_for_statistics(self):
             all_videos = []
             for directory in self.selected_dirs:
-                cache = self.scan_cache.get(directory)
-                if cache:
-                    videos, _, _ = cache
-                    for video in videos:
-                        if not self.is_video_excluded(directory, video):
-                            all_videos.append(video)
+                videos = self._playlist_videos(directory)
+                if videos:
+                    all_videos.extend(videos)
             return all_videos
 
         def is_video_in_excluded_directory(self, video_path, excluded_subdirs):
-            video_dir = os.path.dirname(video_path)
-
-            for excluded_subdir in excluded_subdirs:
-                excluded_subdir = os.path.normpath(excluded_subdir)
-                video_dir_norm = os.path.normpath(video_dir)
-
-                if video_dir_norm == excluded_subdir:
-                    return True
-
-                if video_dir_norm.startswith(excluded_subdir + os.sep):
-                    return True
-
-            return False
+            return self.is_directory_excluded(os.path.dirname(video_path), excluded_subdirs)
 
         def is_video_excluded(self, root_dir, video_path):
-            excluded_videos = self.excluded_videos.get(root_dir, [])
-            video_path = os.path.normpath(video_path)
-            if video_path in excluded_videos:
-                return True
-            excluded_subdirs = self.excluded_subdirs.get(root_dir, [])
-            return self.is_video_in_excluded_directory(video_path, excluded_subdirs)
-
-        def is_directory_excluded(self, directory_path, excluded_subdirs):
-            for excluded_subdir in excluded_subdirs:
-                excluded_subdir = os.path.normpath(excluded_subdir)
-                directory_path_norm = os.path.normpath(directory_path)
+            return self._exclusion_filter(root_dir)(video_path)
+
+        def _exclusion_sets(self, root_dir):
+            # Normalised lookup structures per root, built on first use and
+            # dropped by _invalidate_exclusions whenever that root's exclusions change.
+            with self._exclusion_lock:
+                cached = self._exclusion_cache.get(root_dir)
+                generation = self._exclusion_generation
+            if cached is None:
+                cached = (
+                    frozenset(self.excluded_videos.get(root_dir, [])),
+                    build_path_trie(self.excluded_subdirs.get(root_dir, [])),
+                )
+                # Worker threads build these while the UI thread edits exclusions;
+                # only publish if nothing was invalidated in the meantime.
+                with self._exclusion_lock:
+                    if generation == self._exclusion_generation:
+                        self._exclusion_cache[root_dir] = cached
+            return cached
+
+        def _invalidate_exclusions(self, root_dir=None):
+            with self._exclusion_lock:
+                self._exclusion_generation += 1
+                if root_dir is None:
+                    self._exclusion_cache.clear()
+                else:
+                    self._exclusion_cache.pop(root_dir, None)
 
-                if directory_path_norm == excluded_subdir:
-                    return True
+        def _exclusion_filter(self, root_dir):
+            excluded_videos, excluded_trie = self._exclusion_sets(root_dir)
+            # Videos share parent directories, so each directory is looked up in
+            # the trie once per filter rather than once per video.
+            dir_excluded = {}
 
-                if directory_path_norm.startswith(excluded_subdir + os.sep):
+            def is_excluded(video_path):
+                video_path = os.path.normpath(video_path)
+                if video_path in excluded_videos:
                     return True
+                if not excluded_trie:
+                    return False
+                parent = os.path.dirname(video_path)
+                hit = dir_excluded.get(parent)
+                if hit is None:
+                    hit = dir_excluded[parent] = path_in_trie(excluded_trie, parent)
+                return hit
 
-            return False
-
-        def get_all_subdirectories_of_path(self, parent_path, target_path):
-            subpaths = []
-            try:
-                base = os.path.normpath(target_path)
-                subpaths.append(base)
-                for root, dirs, files in os.walk(base):
-                    for d in dirs:
-                        subpaths.append(os.path.join(root, d))
-                    for f in files:
-                        full = os.path.join(root, f)
-                        if is_video(full):
-                            subpaths.append(full)
-            except Exception as e:
-                self.update_console(f"Error getting subdirectories of {target_path}: {e}")
+            return is_excluded
 
-            return subpaths
+        def is_directory_excluded(self, directory_path, excluded_subdirs):
+            # Normalise the candidate once and test every prefix in a single
+            # startswith call instead of renormalising per excluded entry.
+            exact = frozenset(map(os.path.normpath, excluded_subdirs))
+            directory_path = os.path.normpath(directory_path)
+            if directory_path in exact:
+                return True
+            return directory_path.startswith(tuple(e + os.sep for e in exact))
 
         def update_video_count(self):
+            # Exclusion edits and finishing scans each ask for a recount; a burst
+            # of them produces one count and one console line.
+            if self._count_after_id is not None:
+                self.root.after_cancel(self._count_after_id)
+            self._count_after_id = self.root.after(VIDEO_COUNT_DEBOUNCE_MS, self._do_update_video_count)
+
+        def _do_update_video_count(self):
+            self._count_after_id = None
             total_videos = 0
             total_excluded = 0
             pending = 0
 
             for directory in self.selected_dirs:
-                cache = self.scan_cache.get(directory)
-                if not cache:
+                videos = self._playlist_videos(directory)
+                if videos is None:
                     pending += 1
                     continue
-                videos, _, _ = cache
-
-                excluded_subdirs = self.excluded_subdirs.get(directory, [])
-                excluded_videos = self.excluded_videos.get(directory, [])
-                if excluded_subdirs or excluded_videos:
-                    filtered_videos = []
-                    for video in videos:
-                        if not self.is_video_excluded(directory, video):
-                            filtered_videos.append(video)
-                    total_videos += len(filtered_videos)
-                else:
-                    total_videos += len(videos)
+                total_videos += len(videos)
 
             self.video_count = total_videos
             suffix = f" (scanning {pending}…)" if pending else ""
@@ -1930,7 +2228,9 @@ def select_multiple_folders_and_play():
                             self.update_console("No videos match current filters")
                             return
 
-                        for idx, video_path in enumerate(filtered_sorted):
+                        is_excluded = self._exclusion_filter(selected_dir)
+                        display_names = []
+                        for video_path in filtered_sorted:
                             try:
                                 rel_path = os.path.relpath(video_path, selected_dir)
                             except ValueError:
@@ -1938,11 +2238,14 @@ def select_multiple_folders_and_play():
 
                             display_name = f"▶ {rel_path}"
 
-                            if self.is_video_excluded(selected_dir, video_path):
+                            if is_excluded(video_path):
                                 display_name += " 🚫[EXCLUDED]"
 
-                            self.exclusion_listbox.insert(tk.END, display_name)
-                            self.current_subdirs_mapping[idx] = video_path
+                            display_names.append(display_name)
+
+                        # One Tcl call for the whole list instead of one per row.
+                        self.exclusion_listbox.insert(tk.END, *display_names)
+                        self.current_subdirs_mapping = dict(enumerate(filtered_sorted))
 
                         self.selected_dir_label.config(
                             text=f"Filtered: {len(filtered_sorted)} videos in '{os.path.basename(selected_dir)}'"
@@ -1968,7 +2271,7 @@ def select_multiple_folders_and_play():
 
                     self.root.after(0, show_error)
 
-            threading.Thread(target=process_in_thread, daemon=True).start()
+            self.task_executor.submit(process_in_thread)
 
         def _reapply_filtered_view(self, scroll_pos=None):
             if not hasattr(self, '_filtered_videos') or not hasattr(self, '_base_directory'):
@@ -1986,7 +2289,9 @@ def select_multiple_folders_and_play():
                 self.exclusion_listbox.insert(tk.END, "No videos match the current filters")
                 return
 
-            for idx, video_path in enumerate(filtered_sorted):
+            is_excluded = self._exclusion_filter(selected_dir)
+            display_names = []
+            for video_path in filtered_sorted:
                 try:
                     rel_path = os.path.relpath(video_path, selected_dir)
                 except ValueError:
@@ -1994,11 +2299,13 @@ def select_multiple_folders_and_play():
 
                 display_name = f"▶ {rel_path}"
 
-                if self.is_video_excluded(selected_dir, video_path):
+                if is_excluded(video_path):
                     display_name += " 🚫[EXCLUDED]"
 
-                self.exclusion_listbox.insert(tk.END, display_name)
-                self.current_subdirs_mapping[idx] = video_path
+                display_names.append(display_name)
+
+            self.exclusion_listbox.insert(tk.END, *display_names)
+            self.current_subdirs_mapping = dict(enumerate(filtered_sorted))
 
             self.selected_dir_label.config(
                 text=f"Filtered: {len(filtered_sorted)} videos in '{os.path.basename(selected_dir)}'"
@@ -2016,6 +2323,70 @@ def select_multiple_folders_and_play():
                 except:
                     pass
 
+        def _merge_scans(self, dirs_to_process):
+            # Pressing Play again with the same roots, scans and exclusions
+            # reuses the previous merge instead of renormalising every video.
+            caches = [self.scan_cache.get(d) for d in dirs_to_process]
+            sig = (tuple(dirs_to_process), self._exclusion_generation)
+            last = self._last_play
+            if last and last[0] == sig and all(a is b for a, b in zip(last[1], caches)):
+                all_videos, all_video_to_dir, all_directories = last[2]
+                # Controllers clear these in place on cleanup, so hand out copies.
+                return list(all_videos), dict(all_video_to_dir), list(all_directories)
+
+            all_videos = []
+            all_video_to_dir = {}
+            all_directories_set = set()
+
+            is_stream = self._is_stream_url
+            normpath = os.path.normpath
+            for directory, cache in zip(dirs_to_process, caches):
+                if not cache:
+                    continue
+                videos, video_to_dir, directories = cache
+                videos = [v if is_stream(v) else normpath(v) for v in videos]
+                video_to_dir = {
+                    (k if is_stream(k) else normpath(k)): v for k, v in video_to_dir.items()
+                }
+
+                excluded_subdirs = self.excluded_subdirs.get(directory, [])
+                excluded_videos = self.excluded_videos.get(directory, [])
+                if excluded_subdirs or excluded_videos:
+                    # Filter straight into the merged containers; no per-root
+                    # temporaries to build and copy over.
+                    is_excluded = self._exclusion_filter(directory)
+                    excluded_trie = self._exclusion_sets(directory)[1]
+
+                    for video in videos:
+                        if video not in all_video_to_dir and not is_excluded(video):
+                            all_videos.append(video)
+                            all_video_to_dir[video] = video_to_dir[video]
+
+                    all_directories_set.update(
+                        d for d in directories if not path_in_trie(excluded_trie, d)
+                    )
+                elif all_video_to_dir:
+                    # Overlapping roots ("Movies" and "Movies/Action") share
+                    # videos; the first root to list one keeps it.
+                    for video in videos:
+                        if video not in all_video_to_dir:
+                            all_videos.append(video)
+                            all_video_to_dir[video] = video_to_dir[video]
+                    all_directories_set.update(directories)
+                else:
+                    all_videos.extend(videos)
+                    all_video_to_dir.update(video_to_dir)
+                    all_directories_set.update(directories)
+
+            # Selected roots keep their order, everything else follows sorted;
+            # dict.fromkeys drops the roots from the sorted tail in one pass.
+            all_directories = list(dict.fromkeys(
+                [d for d in dirs_to_process if d in all_directories_set] + sorted(all_directories_set)
+            ))
+
+            self._last_play = (sig, caches, (all_videos, all_video_to_dir, all_directories))
+            return list(all_videos), dict(all_video_to_dir), list(all_directories)
+
         def play_videos(self):
             if not self.selected_dirs:
                 messagebox.showwarning("No Directories", "Please select at least one directory.")
@@ -2030,7 +2401,7 @@ def select_multiple_folders_and_play():
                 # cleanup_hotkeys()
 
             self.root.config(cursor="wait")
-            self.root.update()
+            self.root.update_idletasks()
 
             self.update_console("=" * 100)
             self.update_console("STARTING VIDEO PLAYBACK")
@@ -2044,8 +2415,10 @@ def select_multiple_folders_and_play():
                 if is_filtered_mode and not exclusion_selection:
                     selected_dir = self.get_current_selected_directory()
                     if selected_dir and hasattr(self, '_filtered_videos'):
-                        filtered_videos = [v for v in self._filtered_videos
-                                           if not self.is_video_excluded(selected_dir, v)]
+                        # One filter for the whole list keeps its per-directory memo;
+                        # is_video_excluded would build a fresh filter per video.
+                        filtered_videos = list(filterfalse(self._exclusion_filter(selected_dir),
+                                                           self._filtered_videos))
 
                         if not filtered_videos:
                             def _show_no_videos():
@@ -2055,11 +2428,10 @@ def select_multiple_folders_and_play():
                             self.root.after(0, _show_no_videos)
                             return
 
-                        all_video_to_dir = {}
-                        for video_path in filtered_videos:
-                            all_video_to_dir[video_path] = os.path.dirname(video_path)
+                        all_video_to_dir = {v: os.path.dirname(v) for v in filtered_videos}
 
-                        all_directories = sorted(list(set(all_video_to_dir.values())))
+                        all_dirs_set = set(all_video_to_dir.values())
+                        all_directories = sorted(all_dirs_set)
 
                         dir_selection = self.dir_listbox.curselection()
                         if dir_selection:
@@ -2067,18 +2439,15 @@ def select_multiple_folders_and_play():
                             dirs_order = list(self.selected_dirs)
                             dirs_order = dirs_order[start_idx:] + dirs_order[:start_idx]
 
-                            ordered_dirs = []
-                            all_dirs_set = set(all_directories)
-                            for d in dirs_order:
-                                if d in all_dirs_set:
-                                    ordered_dirs.append(d)
-                            for d in all_directories:
-                                if d not in ordered_dirs:
-                                    ordered_dirs.append(d)
-                            all_directories = ordered_dirs
+                            # Selected roots first, then the rest in sorted order; dict.fromkeys
+                            # drops the repeats without a list membership test per directory.
+                            all_directories = list(dict.fromkeys(
+                                [d for d in dirs_order if d in all_dirs_set] + all_directories
+                            ))
 
                         def _start_filtered_player():
                             self.update_console(f"Playing {len(filtered_videos)} filtered videos")
+                            from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
                             self.controller = VLCPlayerControllerForMultipleDirectory(
                                 filtered_videos, all_video_to_dir, all_directories, self.update_console,
                                 volume=self.volume, is_muted=self.is_muted
@@ -2106,9 +2475,7 @@ def select_multiple_folders_and_play():
                             self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
                             self.player_thread.start()
 
-                            self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None),
-                                                                daemon=True)
-                            self.keys_thread.start()
+                            self._start_hotkeys()
                             self.root.config(cursor="")
 
                         self.root.after(0, _start_filtered_player)
@@ -2136,7 +2503,8 @@ def select_multiple_folders_and_play():
                             else:
                                 all_video_to_dir[video_path] = os.path.dirname(video_path)
 
-                        all_directories = sorted(list(set(all_video_to_dir.values())))
+                        all_dirs_set = set(all_video_to_dir.values())
+                        all_directories = sorted(all_dirs_set)
 
                         dir_selection = self.dir_listbox.curselection()
                         if dir_selection:
@@ -2144,19 +2512,14 @@ def select_multiple_folders_and_play():
                             dirs_order = list(self.selected_dirs)
                             dirs_order = dirs_order[start_idx:] + dirs_order[:start_idx]
 
-                            ordered_dirs = []
-                            all_dirs_set = set(all_directories)
-                            for d in dirs_order:
-                                if d in all_dirs_set:
-                                    ordered_dirs.append(d)
-                            for d in all_directories:
-                                if d not in ordered_dirs:
-                                    ordered_dirs.append(d)
-                            all_directories = ordered_dirs
+                            all_directories = list(dict.fromkeys(
+                                [d for d in dirs_order if d in all_dirs_set] + all_directories
+                            ))
 
                         def _start_selected_player():
                             self.update_console(
                                 f"Playing {len(final_videos)} selected filtered videos")
+                            from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
                             self.controller = VLCPlayerControllerForMultipleDirectory(
                                 final_videos, all_video_to_dir, all_directories, self.update_console,
                                 volume=self.volume, is_muted=self.is_muted
@@ -2184,9 +2547,7 @@ def select_multiple_folders_and_play():
                             self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
                             self.player_thread.start()
 
-                            self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None),
-                                                                daemon=True)
-                            self.keys_thread.start()
+                            self._start_hotkeys()
                             self.root.config(cursor="")
 
                         self.root.after(0, _start_selected_player)
@@ -2214,7 +2575,8 @@ def select_multiple_folders_and_play():
                             else:
                                 all_video_to_dir[video_path] = os.path.dirname(video_path)
 
-                        all_directories = sorted(list(set(all_video_to_dir.values())))
+                        all_dirs_set = set(all_video_to_dir.values())
+                        all_directories = sorted(all_dirs_set)
 
                         dir_selection = self.dir_listbox.curselection()
                         if dir_selection:
@@ -2222,19 +2584,14 @@ def select_multiple_folders_and_play():
                             dirs_order = list(self.selected_dirs)
                             dirs_order = dirs_order[start_idx:] + dirs_order[:start_idx]
 
-                            ordered_dirs = []
-                            all_dirs_set = set(all_directories)
-                            for d in dirs_order:
-                                if d in all_dirs_set:
-                                    ordered_dirs.append(d)
-                            for d in all_directories:
-                                if d not in ordered_dirs:
-                                    ordered_dirs.append(d)
-                            all_directories = ordered_dirs
+                            all_directories = list(dict.fromkeys(
+                                [d for d in dirs_order if d in all_dirs_set] + all_directories
+                            ))
 
                         def _start_selected_player():
                             self.update_console(
                                 f"Playing {len(final_videos)} selected videos")
+                            from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
                             self.controller = VLCPlayerControllerForMultipleDirectory(
                                 final_videos, all_video_to_dir, all_directories, self.update_console,
                                 volume=self.volume, is_muted=self.is_muted
@@ -2262,9 +2619,7 @@ def select_multiple_folders_and_play():
                             self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
                             self.player_thread.start()
 
-                            self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None),
-                                                                daemon=True)
-                            self.keys_thread.start()
+                            self._start_hotkeys()
                             self.root.config(cursor="")
 
                         self.root.after(0, _start_selected_player)
@@ -2273,21 +2628,19 @@ def select_multiple_folders_and_play():
                 if self.ai_mode and self.current_subdirs_mapping:
                     exclusion_selection = self.exclusion_listbox.curselection()
 
-                    ai_video_paths = []
-
+                    mapping = self.current_subdirs_mapping
                     if exclusion_selection:
                         self.update_console("Playing selected AI search results...")
-                        for index in exclusion_selection:
-                            if index in self.current_subdirs_mapping:
-                                path = self.current_subdirs_mapping[index]
-                                if (self._is_stream_url(path)) or (os.path.isfile(path) and is_video(path)):
-                                    ai_video_paths.append(path)
+                        candidates = [mapping[index] for index in exclusion_selection if index in mapping]
                     else:
-                        for i in range(len(self.current_subdirs_mapping)):
-                            if i in self.current_subdirs_mapping:
-                                path = self.current_subdirs_mapping[i]
-                                if (self._is_stream_url(path)) or (os.path.isfile(path) and is_video(path)):
-                                    ai_video_paths.append(path)
+                        candidates = [mapping[i] for i in range(len(mapping)) if i in mapping]
+
+                    on_disk = existing_files(
+                        path for path in candidates if not self._is_stream_url(path) and is_video(path)
+                    )
+                    ai_video_paths = [
+                        path for path in candidates if self._is_stream_url(path) or path in on_disk
+                    ]
 
                     if not ai_video_paths:
                         def _show_no_videos():
@@ -2307,8 +2660,8 @@ def select_multiple_folders_and_play():
                         else:
                             all_video_to_dir[video_path] = os.path.dirname(video_path)
 
-                    all_directories = list(set(all_video_to_dir.values()))
-                    all_directories.sort()
+                    all_dirs_set = set(all_video_to_dir.values())
+                    all_directories = sorted(all_dirs_set)
 
                     dir_selection = self.dir_listbox.curselection()
                     if dir_selection:
@@ -2316,18 +2669,13 @@ def select_multiple_folders_and_play():
                         dirs_order = list(self.selected_dirs)
                         dirs_order = dirs_order[start_idx:] + dirs_order[:start_idx]
 
-                        ordered_dirs = []
-                        all_dirs_set = set(all_directories)
-                        for d in dirs_order:
-                            if d in all_dirs_set:
-                                ordered_dirs.append(d)
-                        for d in all_directories:
-                            if d not in ordered_dirs:
-                                ordered_dirs.append(d)
-                        all_directories = ordered_dirs
+                        all_directories = list(dict.fromkeys(
+                            [d for d in dirs_order if d in all_dirs_set] + all_directories
+                        ))
 
                     def _start_ai_player():
                         self.update_console(f"Playing {len(all_videos)} videos from AI search results")
+                        from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
                         self.controller = VLCPlayerControllerForMultipleDirectory(
                             all_videos, all_video_to_dir, all_directories, self.update_console
                         )
@@ -2356,31 +2704,25 @@ def select_multiple_folders_and_play():
                         self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
                         self.player_thread.start()
 
-                        self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller), daemon=True)
-                        self.keys_thread.start()
+                        self._start_hotkeys()
                         self.root.config(cursor="")
 
                     self.root.after(0, _start_ai_player)
                     return
 
+                # Submit every missing root before blocking on any of them so the
+                # walks overlap; scans already in flight are joined, not repeated.
                 futures = {}
                 for directory in self.selected_dirs:
-                    if self.scan_cache.get(directory) is None and directory not in self.pending_scans:
-                        self.pending_scans.add(directory)
-                        futures[directory] = self.executor.submit(gather_videos_with_directories, directory)
-                for directory, future in list(futures.items()):
+                    future = self._submit_scan(directory)
+                    if future is not None:
+                        futures[directory] = future
+                for directory, future in futures.items():
                     try:
-                        result = future.result()
-                        self.scan_cache.set(directory, result)
+                        self.scan_cache.set(directory, future.result())
                         self.update_console(f"Scan completed: {directory}")
                     except Exception as e:
                         self.update_console(f"Error scanning {directory}: {e}")
-                    finally:
-                        self.pending_scans.discard(directory)
-
-                all_videos = []
-                all_video_to_dir = {}
-                all_directories = []
 
                 dirs_to_process = list(self.selected_dirs)
                 dir_selection = self.dir_listbox.curselection()
@@ -2388,51 +2730,7 @@ def select_multiple_folders_and_play():
                     start_idx = dir_selection[0]
                     dirs_to_process = dirs_to_process[start_idx:] + dirs_to_process[:start_idx]
 
-                for directory in dirs_to_process:
-                    cache = self.scan_cache.get(directory)
-                    if not cache:
-                        continue
-                    videos, video_to_dir, directories = cache
-                    videos = [v if self._is_stream_url(v) else os.path.normpath(v) for v in videos]
-                    new_map = {}
-                    for k, v in video_to_dir.items():
-                        new_key = k if self._is_stream_url(k) else os.path.normpath(k)
-                        new_map[new_key] = v
-                    video_to_dir = new_map
-
-                    excluded_subdirs = self.excluded_subdirs.get(directory, [])
-                    excluded_videos = self.excluded_videos.get(directory, [])
-                    if excluded_subdirs or excluded_videos:
-                        filtered_videos = []
-                        filtered_video_to_dir = {}
-                        filtered_directories = []
-
-                        for video in videos:
-                            if not self.is_video_excluded(directory, video):
-                                filtered_videos.append(video)
-                                filtered_video_to_dir[video] = video_to_dir[video]
-
-                        for dir_path in directories:
-                            if not self.is_directory_excluded(dir_path, excluded_subdirs):
-                                filtered_directories.append(dir_path)
-
-                        all_videos.extend(filtered_videos)
-                        all_video_to_dir.update(filtered_video_to_dir)
-                        all_directories.extend(filtered_directories)
-                    else:
-                        all_videos.extend(videos)
-                        all_video_to_dir.update(video_to_dir)
-                        all_directories.extend(directories)
-
-                all_directories_unordered = set(all_directories)
-                all_directories = []
-                for d in dirs_to_process:
-                    if d in all_directories_unordered:
-                        all_directories.append(d)
-
-                for d in sorted(list(all_directories_unordered)):
-                    if d not in all_directories:
-                        all_directories.append(d)
+                all_videos, all_video_to_dir, all_directories = self._merge_scans(dirs_to_process)
 
                 def _start_player():
                     if not all_videos:
@@ -2441,6 +2739,7 @@ def select_multiple_folders_and_play():
                         return
 
                     self.update_console(f"Playing from {len(all_directories)} directories")
+                    from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
                     self.controller = VLCPlayerControllerForMultipleDirectory(all_videos, all_video_to_dir,
                                                                               all_directories, self.update_console,
                                                                               volume=self.volume,
@@ -2479,8 +2778,7 @@ def select_multiple_folders_and_play():
                     self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
                     self.player_thread.start()
 
-                    self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None), daemon=True)
-                    self.keys_thread.start()
+                    self._start_hotkeys()
                     if self.voice_enabled and self.voice_manager:
                         self.voice_manager.stop_listening()
                         try:
@@ -2553,6 +2851,19 @@ def select_multiple_folders_and_play():
                 pass
 
         def on_directory_select(self, event):
+            # Holding an arrow key fires <<ListboxSelect>> once per row; only the
+            # directory the selection settles on gets its tree loaded. Direct
+            # calls (event is None) still load immediately.
+            if self._select_after_id is not None:
+                self.root.after_cancel(self._select_after_id)
+                self._select_after_id = None
+            if event is None:
+                self._do_directory_select()
+            else:
+                self._select_after_id = self.root.after(DIR_SELECT_DEBOUNCE_MS, self._do_directory_select)
+
+        def _do_directory_select(self):
+            self._select_after_id = None
             self._is_filtered_mode = False
 
             selection = self.dir_listbox.curselection()
@@ -2574,31 +2885,6 @@ def select_multiple_folders_and_play():
             self.collapsed_paths.clear()
             self.load_subdirectories(selected_dir, max_depth=20)
 
-        def get_all_subdirectories(self, directory, prefix="", max_depth=20, current_depth=0):
-            if current_depth >= max_depth:
-                return []
-
-            subdirs = []
-            try:
-                items = sorted(os.listdir(directory))
-                for item in items:
-                    item_path = os.path.join(directory, item)
-                    if os.path.isdir(item_path) or is_video(item_path):
-                        display_name = prefix + item
-                        subdirs.append((item_path, display_name))
-
-                        nested_subdirs = self.get_all_subdirectories(
-                            item_path,
-                            prefix + item + "/",
-                            max_depth,
-                            current_depth + 1
-                        )
-                        subdirs.extend(nested_subdirs)
-            except (PermissionError, OSError):
-                pass
-
-            return subdirs
-
         def clear_exclusion_list(self):
             self.selected_dir_label.config(text="Select a directory to see its folders and videos")
             self.exclusion_listbox.delete(0, tk.END)
@@ -2621,22 +2907,14 @@ def select_multiple_folders_and_play():
 
                 displayed_items = set()
                 if hasattr(self, 'search_query') and self.search_query:
-                    for idx in range(len(self.current_subdirs_mapping)):
-                        if idx in self.current_subdirs_mapping:
-                            displayed_items.add(self.current_subdirs_mapping[idx])
+                    displayed_items = set(self.current_subdirs_mapping.values())
 
                 try:
                     base = os.path.normpath(dir_path)
-                    for root, dirs, files in os.walk(base):
-                        for d in dirs:
-                            subdir_path = os.path.join(root, d)
-                            if not displayed_items or subdir_path in displayed_items:
-                                dir_paths.append(subdir_path)
-                        for f in files:
-                            full = os.path.join(root, f)
-                            if is_video(full):
-                                if not displayed_items or full in displayed_items:
-                                    file_paths.append(full)
+                    # Folders that are already excluded are listed but not entered.
+                    subdirs, videos = list_subtree(base, self._exclusion_sets(dir_path)[1], keep_excluded=True)
+                    dir_paths.extend(d for d in subdirs if not displayed_items or d in displayed_items)
+                    file_paths.extend(v for v in videos if not displayed_items or v in displayed_items)
                 except Exception as e:
                     self.root.after(0, lambda: self.update_console(f"Error during Exclude All: {e}"))
                     self.root.after(0, lambda: [self.exclusion_listbox.delete(0, tk.END),
@@ -2659,6 +2937,7 @@ def select_multiple_folders_and_play():
                         for fp in file_paths:
                             if fp not in existing:
                                 self.excluded_videos[dir_path].append(fp)
+                    self._invalidate_exclusions(dir_path)
 
                     total = len(dir_paths) + len(file_paths)
                     filter_msg = " (matching search filter)" if displayed_items else ""
@@ -2708,9 +2987,7 @@ def select_multiple_folders_and_play():
 
                 displayed_items = set()
                 if hasattr(self, 'search_query') and self.search_query:
-                    for idx in range(len(self.current_subdirs_mapping)):
-                        if idx in self.current_subdirs_mapping:
-                            displayed_items.add(self.current_subdirs_mapping[idx])
+                    displayed_items = set(self.current_subdirs_mapping.values())
 
                 try:
                     for index in indices:
@@ -2720,16 +2997,10 @@ def select_multiple_folders_and_play():
                         if os.path.isdir(target_path):
                             base = os.path.normpath(target_path)
                             dirs_to_exclude.add(base)
-                            for root, dirs, files in os.walk(base):
-                                for d in dirs:
-                                    subdir_path = os.path.join(root, d)
-                                    if not displayed_items or subdir_path in displayed_items:
-                                        dirs_to_exclude.add(subdir_path)
-                                for f in files:
-                                    full = os.path.join(root, f)
-                                    if is_video(full):
-                                        if not displayed_items or full in displayed_items:
-                                            vids_to_exclude.add(full)
+                            subdirs, videos = list_subtree(base, self._exclusion_sets(dir_path)[1],
+                                                           keep_excluded=True)
+                            dirs_to_exclude.update(d for d in subdirs if not displayed_items or d in displayed_items)
+                            vids_to_exclude.update(v for v in videos if not displayed_items or v in displayed_items)
                         else:
                             vids_to_exclude.add(target_path)
                         selected_names.append(os.path.basename(target_path))
@@ -2759,6 +3030,7 @@ def select_multiple_folders_and_play():
                         if vp not in existing_vids:
                             self.excluded_videos[dir_path].append(vp)
                             excluded_count += 1
+                    self._invalidate_exclusions(dir_path)
 
                     if excluded_count > 0:
                         self.update_console(
@@ -2818,9 +3090,7 @@ def select_multiple_folders_and_play():
 
                 displayed_items = set()
                 if hasattr(self, 'search_query') and self.search_query:
-                    for idx in range(len(self.current_subdirs_mapping)):
-                        if idx in self.current_subdirs_mapping:
-                            displayed_items.add(self.current_subdirs_mapping[idx])
+                    displayed_items = set(self.current_subdirs_mapping.values())
 
                 try:
                     for index in indices:
@@ -2830,16 +3100,9 @@ def select_multiple_folders_and_play():
                         if os.path.isdir(target_path):
                             base = os.path.normpath(target_path)
                             dirs_to_include.add(base)
-                            for root, dirs, files in os.walk(base):
-                                for d in dirs:
-                                    subdir_path = os.path.join(root, d)
-                                    if not displayed_items or subdir_path in displayed_items:
-                                        dirs_to_include.add(subdir_path)
-                                for f in files:
-                                    full = os.path.join(root, f)
-                                    if is_video(full):
-                                        if not displayed_items or full in displayed_items:
-                                            vids_to_include.add(full)
+                            subdirs, videos = list_subtree(base)
+                            dirs_to_include.update(d for d in subdirs if not displayed_items or d in displayed_items)
+                            vids_to_include.update(v for v in videos if not displayed_items or v in displayed_items)
                         else:
                             vids_to_include.add(target_path)
                         selected_names.append(os.path.basename(target_path))
@@ -2874,6 +3137,7 @@ def select_multiple_folders_and_play():
                             self.excluded_videos[dir_path] = remaining_v
                         else:
                             del self.excluded_videos[dir_path]
+                    self._invalidate_exclusions(dir_path)
 
                     if included_count > 0:
                         self.update_console(
@@ -2963,17 +3227,19 @@ def select_multiple_folders_and_play():
             if had_subdir_excl or had_video_excl:
                 excluded_count = (len(self.excluded_subdirs.get(selected_dir, [])) +
                                   len(self.excluded_videos.get(selected_dir, [])))
+                dir_name = os.path.basename(selected_dir)
                 result = messagebox.askyesno(
                     "Confirm",
-                    f"Clear all exclusions for {os.path.basename(selected_dir)}?"
+                    f"Clear all exclusions for {dir_name}?"
                 )
                 if result:
                     if had_subdir_excl:
                         del self.excluded_subdirs[selected_dir]
                     if had_video_excl:
                         del self.excluded_videos[selected_dir]
+                    self._invalidate_exclusions(selected_dir)
                     self.update_console(
-                        f"Cleared all {excluded_count} exclusions for '{os.path.basename(selected_dir)}'")
+                        f"Cleared all {excluded_count} exclusions for '{dir_name}'")
                     if self.save_directories:
                         self.save_preferences()
 
@@ -2986,23 +3252,113 @@ def select_multiple_folders_and_play():
 
                     self.update_video_count()
 
+        def _subdir_rows(self, base, start, max_depth, excluded_dir_set, excluded_vid_set, show_videos,
+                         only_excluded, listed=None):
+            """(path, display name) rows for the tree under start, indented relative to base.
+
+            When listed is a list, each folder whose contents were read is appended
+            to it as (path, mtime) so the caller can tell later if the rows are stale.
+            """
+            norm_base = os.path.normpath(base)
+            rel = os.path.relpath(start, base)
+            start_depth = 0 if rel == '.' else rel.count(os.sep) + 1
+            start_name = os.path.basename(start) if rel != '.' else os.path.basename(base)
+            search_query = getattr(self, 'search_query', None)
+            expand_all = self.expand_all_var.get()
+            items = []
+
+            # Pre-order walk over list_tree_entries: each folder's listing is
+            # memoised by its mtime, so redrawing an unchanged tree re-reads nothing.
+            stack = [(start, start_name, start_depth)]
+            while stack:
+                if self.resource_manager.is_shutting_down():
+                    break
+                root, name, depth = stack.pop()
+                if depth > max_depth:
+                    continue
+
+                norm_root = os.path.normpath(root)
+                if expand_all:
+                    can_show_children = norm_root not in self.collapsed_paths
+                else:
+                    can_show_children = (norm_root == norm_base) or (norm_root in self.expanded_paths)
+
+                dir_name_matches = (not search_query) or (search_query in name.lower())
+                is_child_of_match = self.is_child_of_matching_parent(root, base, search_query)
+                dir_has_matching_children = self.matches_search(root, search_query) if search_query else True
+                show_this_dir = (not search_query) or dir_name_matches or is_child_of_match or dir_has_matching_children
+
+                indent = INDENTS[depth] if depth < len(INDENTS) else "  " * depth
+                video_indent = indent + "  "
+                include_dir = (not only_excluded) or (root in excluded_dir_set)
+
+                if include_dir and show_this_dir:
+                    indented_name = indent + '📁' + name
+                    if root in excluded_dir_set:
+                        indented_name += "🚫[EXCLUDED]"
+                    items.append((root, indented_name))
+
+                if not can_show_children:
+                    continue
+                if listed is not None:
+                    listed.append((root, self._dir_mtime(root)))
+                entries = list_tree_entries(root)
+
+                if show_videos:
+                    for entry_name, full_path, is_dir in entries:
+                        if is_dir:
+                            continue
+                        include_vid = (not only_excluded) or (full_path in excluded_vid_set)
+                        video_name_matches = (not search_query) or (search_query in entry_name.lower())
+                        show_this_video = video_name_matches or dir_name_matches or is_child_of_match
+
+                        if include_vid and show_this_video and show_this_dir:
+                            v_name = video_indent + '▶' + entry_name
+                            if self.favorites_manager.is_favorite(full_path, base):
+                                v_name += " ⭐"
+                            if full_path in excluded_vid_set:
+                                v_name += "🚫[EXCLUDED]"
+                            items.append((full_path, v_name))
+
+                # Reversed so the stack pops subfolders in name order.
+                stack.extend(reversed([(path, entry_name, depth + 1)
+                                       for entry_name, path, is_dir in entries if is_dir]))
+
+            return items
+
         def load_subdirectories(self, directory, max_depth=20, restore_path=None, restore_scroll=None):
             self.current_max_depth = max_depth
             if self.show_only_excluded:
                 self.selected_dir_label.config(text=f"Excluded items in: {os.path.basename(directory)}")
             else:
-                _cache = self.scan_cache.get(directory)
-                if _cache:
-                    _videos, _, _ = _cache
-                    _excluded_subdirs = self.excluded_subdirs.get(directory, [])
-                    _excluded_videos = self.excluded_videos.get(directory, [])
-                    if _excluded_subdirs or _excluded_videos:
-                        _count = sum(1 for v in _videos if not self.is_video_excluded(directory, v))
-                    else:
-                        _count = len(_videos)
+                _videos = self._playlist_videos(directory)
+                if _videos is not None:
+                    _count = len(_videos)
                     self.selected_dir_label.config(text=f"All items in: {os.path.basename(directory)} ({_count} videos)")
                 else:
                     self.selected_dir_label.config(text=f"All items in: {os.path.basename(directory)}")
+
+            # Everything that shapes the rendered rows; when it matches what the
+            # listbox currently shows and none of the folders it listed has changed
+            # since, re-selecting the same directory is a no-op. A search can match
+            # anywhere below the shown folders, so its rows are always rebuilt.
+            subdir_key = None
+            if not (isinstance(directory, str) and directory.startswith("gdrive://")) \
+                    and not getattr(self, 'search_query', None):
+                subdir_key = (
+                    directory, max_depth, self._exclusion_generation,
+                    self.scan_cache.get(directory), self.show_videos, self.show_only_excluded,
+                    self.expand_all_var.get(), frozenset(self.expanded_paths), frozenset(self.collapsed_paths),
+                )
+                if (restore_path is None and subdir_key == self._last_subdir_key
+                        and self.current_subdirs_mapping is self._last_subdir_mapping
+                        and len(self.current_subdirs_mapping) == self.exclusion_listbox.size()
+                        and all(self._dir_mtime(path) == mtime for path, mtime in self._last_subdir_listed)):
+                    if restore_scroll:
+                        self.exclusion_listbox.yview_moveto(restore_scroll[0])
+                    return
+            self._last_subdir_key = None
+
             self.exclusion_listbox.delete(0, tk.END)
             self.exclusion_listbox.insert(tk.END, "Loading...")
             self.current_subdirs_mapping = {}
@@ -3062,10 +3418,8 @@ def select_multiple_folders_and_play():
                             self.exclusion_listbox.insert(tk.END, "No items")
                             self.current_subdirs_mapping = {}
                         else:
-                            self.current_subdirs_mapping = {}
-                            for idx, (p, name) in enumerate(items):
-                                self.exclusion_listbox.insert(tk.END, name)
-                                self.current_subdirs_mapping[idx] = p
+                            self.exclusion_listbox.insert(tk.END, *(name for _, name in items))
+                            self.current_subdirs_mapping = dict(enumerate(p for p, _ in items))
                         if restore_scroll:
                             try:
                                 self.exclusion_listbox.yview_moveto(restore_scroll[0])
@@ -3098,72 +3452,9 @@ def select_multiple_folders_and_play():
                         if self._subdir_load_token is not token:
                             return
                     base = os.path.abspath(directory)
-                    base_sep = os.sep
-                    items = []
-
-                    for root, dirs, files in os.walk(base):
-                        if self.resource_manager.is_shutting_down():
-                            break
-                        rel = os.path.relpath(root, base)
-                        depth = 0 if rel == '.' else rel.count(base_sep) + 1
-                        if depth > max_depth:
-                            dirs[:] = []
-                            continue
-
-                        norm_root = os.path.normpath(root)
-                        norm_base = os.path.normpath(base)
-
-                        if self.expand_all_var.get():
-                            if norm_root in self.collapsed_paths:
-                                dirs[:] = []
-                            can_show_children = norm_root not in self.collapsed_paths
-                        else:
-                            is_expanded_here = (norm_root == norm_base) or (norm_root in self.expanded_paths)
-                            if not is_expanded_here:
-                                dirs[:] = []
-                            can_show_children = is_expanded_here
-
-                        dir_name_matches = (not getattr(self, 'search_query', None)) or (
-                                self.search_query in os.path.basename(root).lower())
-                        is_child_of_match = self.is_child_of_matching_parent(root, base,
-                                                                             getattr(self, 'search_query', None))
-                        dir_has_matching_children = self.matches_search(root,
-                                                                        getattr(self, 'search_query', None)) if getattr(
-                            self, 'search_query', None) else True
-                        show_this_dir = (not getattr(self, 'search_query',
-                                                     None)) or dir_name_matches or is_child_of_match or dir_has_matching_children
-
-                        indent_level = 0 if rel == '.' else rel.count(base_sep) + 1
-                        name = os.path.basename(root) if rel != '.' else os.path.basename(base)
-                        include_dir = (not only_excluded) or (root in excluded_dir_set)
-
-                        if include_dir and show_this_dir:
-                            indented_name = ("  " * indent_level) + '📁' + name
-                            if root in excluded_dir_set:
-                                indented_name += "🚫[EXCLUDED]"
-                            items.append((root, indented_name))
-
-                        if show_videos and can_show_children:
-                            try:
-                                with os.scandir(root) as it:
-                                    for entry in it:
-                                        if entry.is_file() and is_video(entry.name):
-                                            full_path = entry.path
-                                            include_vid = (not only_excluded) or (full_path in excluded_vid_set)
-
-                                            video_name_matches = (not getattr(self, 'search_query', None)) or (
-                                                    self.search_query in entry.name.lower())
-                                            show_this_video = video_name_matches or dir_name_matches or is_child_of_match
-
-                                            if include_vid and show_this_video and show_this_dir:
-                                                v_name = ("  " * (indent_level + 1)) + '▶' + entry.name
-                                                if self.favorites_manager.is_favorite(full_path, base):
-                                                    v_name += " ⭐"
-                                                if full_path in excluded_vid_set:
-                                                    v_name += "🚫[EXCLUDED]"
-                                                items.append((full_path, v_name))
-                            except PermissionError:
-                                pass
+                    listed = []
+                    items = self._subdir_rows(base, base, max_depth, excluded_dir_set, excluded_vid_set,
+                                              show_videos, only_excluded, listed)
 
                     def post_chunks():
                         if self._subdir_load_token is not token:
@@ -3189,15 +3480,17 @@ def select_multiple_folders_and_play():
                             if self._subdir_load_token is not token:
                                 return
                             end = min(start + chunk_size, total)
-                            for i in range(start, end):
-                                _, indented_name = items[i]
-                                self.exclusion_listbox.insert(tk.END, indented_name)
-                            for idx in range(start, end):
-                                mapping[idx] = items[idx][0]
+                            # One Tcl call per chunk rather than one per row.
+                            chunk = items[start:end]
+                            self.exclusion_listbox.insert(tk.END, *(name for _, name in chunk))
+                            mapping.update(zip(range(start, end), (path for path, _ in chunk)))
                             if end < total:
                                 self.root.after(1, lambda: insert_chunk(end))
                             else:
                                 self.current_subdirs_mapping = mapping
+                                self._last_subdir_key = subdir_key
+                                self._last_subdir_mapping = mapping
+                                self._last_subdir_listed = listed
                                 self.video_preview_manager.attach_to_listbox(
                                     self.exclusion_listbox,
                                     self.current_subdirs_mapping
@@ -3274,7 +3567,7 @@ def select_multiple_folders_and_play():
                                activebackground=c["hover_bg"],
                                activeforeground=c["hover_fg"],
                                relief="flat", bd=1,
-                               font=("Segoe UI", 9))
+                               font=self.small_font)
                 for entry in entries:
                     if entry is None:
                         menu.add_separator()
@@ -3286,13 +3579,12 @@ def select_multiple_folders_and_play():
             def make_toolbar_btn(text, command=None, menu=None, is_action=False, play=False):
                 c = _tb_colors()
                 fg = c["play_fg"] if play else c["fg"]
-                font_weight = "bold" if play else "normal"
                 btn = tk.Label(
                     self.toolbar,
                     text=text,
                     bg=c["bg"],
                     fg=fg,
-                    font=("Segoe UI", 9, font_weight),
+                    font=self.small_bold_font if play else self.small_font,
                     padx=10, pady=4,
                     cursor="hand2"
                 )
@@ -3355,7 +3647,7 @@ def select_multiple_folders_and_play():
                                activeforeground=c["hover_fg"],
                                selectcolor=_sel_color,
                                relief="flat", bd=1,
-                               font=("Segoe UI", 9))
+                               font=self.small_font)
             for mode, lbl in [("loop_on", "Loop On"), ("loop_off", "Loop Off"), ("shuffle", "Shuffle")]:
                 loop_sub.add_radiobutton(
                     label=lbl,
@@ -3369,7 +3661,7 @@ def select_multiple_folders_and_play():
                                     activebackground=c["hover_bg"],
                                     activeforeground=c["hover_fg"],
                                     relief="flat", bd=1,
-                                    font=("Segoe UI", 9))
+                                    font=self.small_font)
             playback_menu.add_cascade(label="Loop Mode", menu=loop_sub)
             playback_menu.add_separator()
             playback_menu.add_command(label="Sleep Timer", command=self._show_sleep_timer_dialog)
@@ -3402,7 +3694,7 @@ def select_multiple_folders_and_play():
                     text=label,
                     bg=c["bg"],
                     fg=a[0],
-                    font=("Segoe UI", 9, "bold"),
+                    font=self.small_bold_font,
                     padx=9, pady=3,
                     cursor="hand2",
                     relief="flat",
@@ -3440,7 +3732,7 @@ def select_multiple_folders_and_play():
                 text="",
                 bg=_tb_colors()["bg"],
                 fg=_tb_colors()["fg"],
-                font=("Segoe UI", 9),
+                font=self.small_font,
                 padx=8, pady=4,
                 cursor="hand2"
             )
@@ -3488,7 +3780,7 @@ def select_multiple_folders_and_play():
                 text="🌙" if not self.dark_mode else "☀",
                 bg=_tb_colors()["bg"],
                 fg=_tb_colors()["fg"],
-                font=("Segoe UI", 10),
+                font=self.normal_font,
                 padx=8, pady=4,
                 cursor="hand2"
             )
@@ -3514,7 +3806,7 @@ def select_multiple_folders_and_play():
                 text="▶  Play Videos",
                 bg=_tb_colors()["bg"],
                 fg=_tb_colors()["play_fg"],
-                font=("Segoe UI", 9, "bold"),
+                font=self.small_bold_font,
                 padx=12, pady=4,
                 cursor="hand2"
             )
@@ -3633,23 +3925,21 @@ def select_multiple_folders_and_play():
 
         def add_directory(self):
             directory = filedialog.askdirectory(title="Select a Directory")
-            if directory and directory not in self.selected_dirs:
+            if directory and directory not in self._selected_set:
                 self.selected_dirs.append(directory)
+                self._selected_set.add(directory)
 
-                display_name = directory
-                if len(directory) > 60:
-                    display_name = os.path.basename(directory)
-                    parent = os.path.dirname(directory)
-                    if parent:
-                        display_name = f"{os.path.basename(parent)}/{display_name}"
-                    display_name = f".../{display_name}"
-
-                self.dir_listbox.insert(tk.END, display_name)
                 self.update_console(f"Added directory: {directory}")
                 self.update_console(f"Scanning '{os.path.basename(directory)}' for videos...")
-                self._submit_scan(directory)
+                self._insert_dir_row(directory)
                 self.update_video_count()
                 self.save_preferences()
+            elif directory:
+                # Re-selecting a directory that is already listed forces a rescan.
+                self.invalidate_dir_cache(directory)
+                self.update_console(f"Rescanning '{os.path.basename(directory)}' for videos...")
+                self._submit_scan(directory)
+                self.update_video_count()
 
         def remove_directory(self):
             selected_indices = self.dir_listbox.curselection()
@@ -3657,9 +3947,11 @@ def select_multiple_folders_and_play():
                 messagebox.showinfo("Information", "Please select a directory to remove.")
                 return
 
-            for i in sorted(selected_indices, reverse=True):
+            to_remove = set(selected_indices)
+            for i in sorted(to_remove):
                 dir_to_remove = self.selected_dirs[i]
-                self.update_console(f"Removed directory: {os.path.basename(dir_to_remove)}")
+                dir_name = os.path.basename(dir_to_remove)
+                self.update_console(f"Removed directory: {dir_name}")
 
                 total_cleared = 0
                 if dir_to_remove in self.excluded_subdirs:
@@ -3668,20 +3960,37 @@ def select_multiple_folders_and_play():
                 if dir_to_remove in self.excluded_videos:
                     total_cleared += len(self.excluded_videos[dir_to_remove])
                     del self.excluded_videos[dir_to_remove]
+                self._invalidate_exclusions(dir_to_remove)
                 if total_cleared:
-                    self.update_console(f"Cleared {total_cleared} exclusions for '{os.path.basename(dir_to_remove)}'")
+                    self.update_console(f"Cleared {total_cleared} exclusions for '{dir_name}'")
 
-                if hasattr(self, 'scan_cache') and self.scan_cache.get(dir_to_remove) is not None:
-                    self.scan_cache.delete(dir_to_remove)
+                if hasattr(self, 'scan_cache'):
+                    self.invalidate_dir_cache(dir_to_remove)
                 if hasattr(self, 'pending_scans'):
-                    self.pending_scans.discard(dir_to_remove)
+                    with self._pending_scans_lock:
+                        self.pending_scans.discard(dir_to_remove)
+                        future = self._scan_futures.pop(dir_to_remove, None)
+                        slot = self._scan_slots.pop(dir_to_remove, None)
+                        if slot is not None:
+                            self._scan_cancel_slots[slot] = 1
+                    if future is not None:
+                        future.cancel()
 
                 # Remove cached thumbnail blobs for this directory
                 if hasattr(self, 'video_preview_manager') and self.video_preview_manager:
                     self.video_preview_manager.evict_for_directory(dir_to_remove)
 
-                self.dir_listbox.delete(i)
-                self.selected_dirs.pop(i)
+                self._selected_set.discard(dir_to_remove)
+                self._display_names.pop(dir_to_remove, None)
+
+            # Rebuild the listbox once instead of deleting row by row; the
+            # current row texts keep any pending-scan markers.
+            keep = [i for i in range(len(self.selected_dirs)) if i not in to_remove]
+            rows = self.dir_listbox.get(0, tk.END)
+            self.selected_dirs[:] = [self.selected_dirs[i] for i in keep]
+            self.dir_listbox.delete(0, tk.END)
+            if keep:
+                self.dir_listbox.insert(tk.END, *[rows[i] for i in keep])
 
             if self.current_selected_dir_index is not None:
                 if self.current_selected_dir_index >= len(self.selected_dirs):
@@ -3822,14 +4131,13 @@ def select_multiple_folders_and_play():
                         elif os.path.isdir(item_path):
                             selected_folders.append(item_path)
 
+                    # The scan skips excluded subtrees instead of listing them and
+                    # filtering every video afterwards.
+                    excluded_dirs = list(self.excluded_subdirs.get(selected_dir, ()))
                     for folder in selected_folders:
                         try:
-                            for root, dirs, files in os.walk(folder):
-                                for f in files:
-                                    full_path = os.path.join(root, f)
-                                    if is_video(full_path):
-                                        if not self.is_video_excluded(selected_dir, full_path):
-                                            selected_videos.append(full_path)
+                            videos = gather_videos(folder, excluded_dirs)
+                            selected_videos.extend(v for v in videos if not self.is_video_excluded(selected_dir, v))
                         except Exception as e:
                             self.update_console(f"Error reading folder {folder}: {e}")
 
@@ -3846,7 +4154,7 @@ def select_multiple_folders_and_play():
                     else:
                         self.root.after(0, lambda: messagebox.showwarning("Warning", "No videos found in selection"))
 
-                threading.Thread(target=collect_selected_videos, daemon=True).start()
+                self.task_executor.submit(collect_selected_videos)
             else:
                 self.update_console("Loading grid view for entire directory...")
 
@@ -3854,12 +4162,13 @@ def select_multiple_folders_and_play():
                     cache = self.scan_cache.get(selected_dir)
                     if cache:
                         videos, _, _ = cache
-                        filtered = [v for v in videos if not self.is_video_excluded(selected_dir, v)]
+                        is_excluded = self._exclusion_filter(selected_dir)
+                        filtered = [v for v in videos if not is_excluded(v)]
                         self.root.after(0, lambda: self._open_grid_view(filtered))
                     else:
                         self.root.after(0, lambda: messagebox.showwarning("Warning", "No videos found"))
 
-                threading.Thread(target=collect_all_videos, daemon=True).start()
+                self.task_executor.submit(collect_all_videos)
 
         def _open_grid_view(self, videos):
             if not videos:
@@ -3882,10 +4191,11 @@ def select_multiple_folders_and_play():
                 # cleanup_hotkeys()
 
             all_video_to_dir = {v: os.path.dirname(v) for v in videos}
-            all_directories = sorted(list(set(all_video_to_dir.values())))
+            all_directories = sorted(set(all_video_to_dir.values()))
 
             self.update_console(f"Playing {len(videos)} videos from grid selection")
 
+            from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
             self.controller = VLCPlayerControllerForMultipleDirectory(
                 videos, all_video_to_dir, all_directories, self.update_console,
                 volume=self.volume, is_muted=self.is_muted
@@ -3905,8 +4215,7 @@ def select_multiple_folders_and_play():
             self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
             self.player_thread.start()
 
-            self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None), daemon=True)
-            self.keys_thread.start()
+            self._start_hotkeys()
 
             def init_overlay_delayed(ctrl=self.controller):
                 time.sleep(1)
@@ -3943,21 +4252,19 @@ def select_multiple_folders_and_play():
                         all_videos = []
 
                         if search_active and self.current_subdirs_mapping:
-                            for i in range(len(self.current_subdirs_mapping)):
-                                if i in self.current_subdirs_mapping:
-                                    path = self.current_subdirs_mapping[i]
-                                    if os.path.isfile(path) and is_video(path):
-                                        all_videos.append(path)
+                            mapping = self.current_subdirs_mapping
+                            candidates = [
+                                mapping[i] for i in range(len(mapping))
+                                if i in mapping and is_video(mapping[i])
+                            ]
+                            on_disk = existing_files(candidates)
+                            all_videos = [path for path in candidates if path in on_disk]
                         else:
                             cache = self.scan_cache.get(selected_dir)
                             if cache:
                                 videos, _, _ = cache
-                                excluded_subdirs = self.excluded_subdirs.get(selected_dir, [])
-                                excluded_videos = self.excluded_videos.get(selected_dir, [])
-
-                                for video in videos:
-                                    if not self.is_video_excluded(selected_dir, video):
-                                        all_videos.append(video)
+                                is_excluded = self._exclusion_filter(selected_dir)
+                                all_videos = [v for v in videos if not is_excluded(v)]
 
                         def finish_collection():
                             if all_videos:
@@ -3966,15 +4273,81 @@ def select_multiple_folders_and_play():
                             else:
                                 messagebox.showwarning("Warning", "No videos found to add to playlist")
 
-                        self.root.after(0, finish_collection)
+                        self.root.after_idle(finish_collection)
 
                     except Exception as e:
                         def show_error():
                             messagebox.showerror("Error", f"Failed to collect videos: {e}")
 
-                        self.root.after(0, show_error)
+                        self.root.after_idle(show_error)
 
-                threading.Thread(target=collect_all_videos, daemon=True).start()
+                self.task_executor.submit(collect_all_videos)
+
+        def _reload_hotkeys(self, hotkeys):
+            from key_press import reload_hotkeys
+            reload_hotkeys(self.controller, hotkeys)
+
+        def _start_hotkeys(self):
+            from key_press import listen_keys
+            hotkeys = self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None
+            # listen_keys only registers hooks; the keyboard package dispatches
+            # them from its own listener, so no thread of ours is needed.
+            listen_keys(self.controller, hotkeys)
+
+        def _controller_reusable(self):
+            controller = self.controller
+            return bool(
+                controller and controller.running and not controller.is_cleaned_up
+                and self.player_thread and self.player_thread.is_alive()
+            )
+
+        def _start_controller(self, videos, video_to_dir, directories, message, loop_mode=None, use_queue=False):
+            self.update_console(message)
+            if self._controller_reusable():
+                # Keep the live VLC instance, player thread and hotkeys; only the
+                # playlist changes.
+                self.controller.set_loop_mode(loop_mode or self.loop_mode)
+                self.controller.set_queue_manager(self.queue_manager if use_queue else None)
+                if use_queue:
+                    self.controller.set_queue_ui_refresh_callback(lambda: self.queue_manager.ui._refresh_queue())
+                self.controller.replace_queue(videos, video_to_dir, directories)
+                return
+
+            from vlc_player_controller import VLCPlayerControllerForMultipleDirectory
+            self.controller = VLCPlayerControllerForMultipleDirectory(
+                videos, video_to_dir, directories, self.update_console,
+                volume=self.volume, is_muted=self.is_muted
+            )
+            self.controller.set_loop_mode(loop_mode or self.loop_mode)
+            self.controller.set_volume_save_callback(self._save_volume_callback)
+            self.controller.set_watch_history_callback(
+                self.watch_history_manager.track_video_playback
+            )
+            self.controller.set_resume_manager(self.resume_manager)
+
+            if use_queue:
+                self.controller.set_queue_manager(self.queue_manager)
+                self.controller.set_queue_ui_refresh_callback(lambda: self.queue_manager.ui._refresh_queue())
+
+            initial_speed = self.speed_var.get()
+            if initial_speed != 1.0:
+                self.controller.set_initial_playback_rate(initial_speed)
+                self.update_console(f"Initial playback speed set to {initial_speed}x")
+
+            self.controller.set_start_index(0)
+            self.controller.set_video_change_callback(self.on_video_changed)
+            self.controller.set_stop_callback(self._on_player_stopped)
+
+            if self.player_thread and self.player_thread.is_alive():
+                self.controller.running = False
+                self.player_thread.join(timeout=3.0)
+
+            self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
+            self.player_thread.start()
+
+            self._start_hotkeys()
+            time.sleep(1)
+            self.controller.init_overlay()
 
         def _manage_playlists(self):
             self.playlist_manager.show_manager()
@@ -3984,7 +4357,7 @@ def select_multiple_folders_and_play():
                 messagebox.showwarning("Warning", "Playlist is empty")
                 return
 
-            if self.controller:
+            if self.controller and not self._controller_reusable():
                 try:
                     self.controller.stop()
                 except Exception:
@@ -3997,62 +4370,27 @@ def select_multiple_folders_and_play():
             self.update_console("=" * 100)
 
             all_video_to_dir = {}
-            all_directories = []
+            is_stream = self._is_stream_url
+            on_disk = existing_files(v for v in videos if not is_stream(v))
 
             for video_path in videos:
-                if self._is_stream_url(video_path):
-                    video_dir = "STREAMS"
-                    all_video_to_dir[video_path] = video_dir
-                    if video_dir not in all_directories:
-                        all_directories.append(video_dir)
-                elif os.path.isfile(video_path):
-                    video_dir = os.path.dirname(video_path)
-                    all_video_to_dir[video_path] = video_dir
-                    if video_dir not in all_directories:
-                        all_directories.append(video_dir)
-
-            all_directories.sort()
+                if is_stream(video_path):
+                    all_video_to_dir[video_path] = "STREAMS"
+                elif video_path in on_disk:
+                    all_video_to_dir[video_path] = on_disk[video_path]
+
+            all_directories = sorted(set(all_video_to_dir.values()))
             valid_videos = list(all_video_to_dir.keys())
 
             if not valid_videos:
                 messagebox.showwarning("Warning", "No valid videos found in playlist")
                 return
 
-            def start_playlist_player():
-                self.update_console(f"Playing playlist with {len(valid_videos)} videos")
-                self.controller = VLCPlayerControllerForMultipleDirectory(
-                    valid_videos, all_video_to_dir, all_directories, self.update_console,
-                    volume=self.volume, is_muted=self.is_muted
-                )
-                self.controller.set_loop_mode(self.loop_mode)
-                self.controller.set_volume_save_callback(self._save_volume_callback)
-                self.controller.set_watch_history_callback(
-                    self.watch_history_manager.track_video_playback
-                )
-                self.controller.set_resume_manager(self.resume_manager)
-
-                initial_speed = self.speed_var.get()
-                if initial_speed != 1.0:
-                    self.controller.set_initial_playback_rate(initial_speed)
-                    self.update_console(f"Initial playback speed set to {initial_speed}x")
-
-                self.controller.set_start_index(0)
-                self.controller.set_video_change_callback(self.on_video_changed)
-                self.controller.set_stop_callback(self._on_player_stopped)
-
-                if self.player_thread and self.player_thread.is_alive():
-                    self.controller.running = False
-                    self.player_thread.join(timeout=3.0)
-
-                self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
-                self.player_thread.start()
-
-                self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None), daemon=True)
-                self.keys_thread.start()
-                time.sleep(1)
-                self.controller.init_overlay()
-
-            threading.Thread(target=start_playlist_player, daemon=True).start()
+            self.task_executor.submit(
+                self._start_controller,
+                valid_videos, all_video_to_dir, all_directories,
+                f"Playing playlist with {len(valid_videos)} videos"
+            )
 
         def _show_queue_manager(self):
             self.queue_manager.show_manager()
@@ -4078,7 +4416,7 @@ def select_multiple_folders_and_play():
             if not videos:
                 return
 
-            if self.controller:
+            if self.controller and not self._controller_reusable():
                 try:
                     self.controller.stop()
                 except Exception:
@@ -4087,65 +4425,28 @@ def select_multiple_folders_and_play():
                 # cleanup_hotkeys()
 
             all_video_to_dir = {}
-            all_directories = []
+            is_stream = self._is_stream_url
+            on_disk = existing_files(v for v in videos if not is_stream(v))
 
             for video_path in videos:
-                if self._is_stream_url(video_path):
-                    video_dir = "STREAMS"
-                    all_video_to_dir[video_path] = video_dir
-                    if video_dir not in all_directories:
-                        all_directories.append(video_dir)
-                elif os.path.isfile(video_path):
-                    video_dir = os.path.dirname(video_path)
-                    all_video_to_dir[video_path] = video_dir
-                    if video_dir not in all_directories:
-                        all_directories.append(video_dir)
-
-            all_directories.sort()
+                if is_stream(video_path):
+                    all_video_to_dir[video_path] = "STREAMS"
+                elif video_path in on_disk:
+                    all_video_to_dir[video_path] = on_disk[video_path]
+
+            all_directories = sorted(set(all_video_to_dir.values()))
             valid_videos = list(all_video_to_dir.keys())
 
             if not valid_videos:
                 messagebox.showwarning("Warning", "No valid videos found")
                 return
 
-            def start_queue_player():
-                self.update_console(f"Playing queue with {len(valid_videos)} videos")
-                self.controller = VLCPlayerControllerForMultipleDirectory(
-                    valid_videos, all_video_to_dir, all_directories, self.update_console,
-                    volume=self.volume, is_muted=self.is_muted
-                )
-                self.controller.set_loop_mode("loop_off")
-                self.controller.set_volume_save_callback(self._save_volume_callback)
-                self.controller.set_watch_history_callback(
-                    self.watch_history_manager.track_video_playback
-                )
-                self.controller.set_resume_manager(self.resume_manager)
-
-                self.controller.set_queue_manager(self.queue_manager)
-                self.controller.set_queue_ui_refresh_callback(lambda: self.queue_manager.ui._refresh_queue())
-
-                initial_speed = self.speed_var.get()
-                if initial_speed != 1.0:
-                    self.controller.set_initial_playback_rate(initial_speed)
-                    self.update_console(f"Initial playback speed set to {initial_speed}x")
-
-                self.controller.set_start_index(0)
-                self.controller.set_video_change_callback(self.on_video_changed)
-                self.controller.set_stop_callback(self._on_player_stopped)
-
-                if self.player_thread and self.player_thread.is_alive():
-                    self.controller.running = False
-                    self.player_thread.join(timeout=3.0)
-
-                self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
-                self.player_thread.start()
-
-                self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None), daemon=True)
-                self.keys_thread.start()
-                time.sleep(1)
-                self.controller.init_overlay()
-
-            threading.Thread(target=start_queue_player, daemon=True).start()
+            self.task_executor.submit(
+                self._start_controller,
+                valid_videos, all_video_to_dir, all_directories,
+                f"Playing queue with {len(valid_videos)} videos",
+                loop_mode="loop_off", use_queue=True
+            )
 
         def _show_watch_history(self):
             self.watch_history_manager.show_manager()
@@ -4155,7 +4456,7 @@ def select_multiple_folders_and_play():
                 messagebox.showwarning("Warning", "No videos to play")
                 return
 
-            if self.controller:
+            if self.controller and not self._controller_reusable():
                 try:
                     self.controller.stop()
                 except Exception:
@@ -4168,62 +4469,27 @@ def select_multiple_folders_and_play():
             self.update_console("=" * 100)
 
             all_video_to_dir = {}
-            all_directories = []
+            is_stream = self._is_stream_url
+            on_disk = existing_files(v for v in videos if not is_stream(v))
 
             for video_path in videos:
-                if self._is_stream_url(video_path):
-                    video_dir = "STREAMS"
-                    all_video_to_dir[video_path] = video_dir
-                    if video_dir not in all_directories:
-                        all_directories.append(video_dir)
-                elif os.path.isfile(video_path):
-                    video_dir = os.path.dirname(video_path)
-                    all_video_to_dir[video_path] = video_dir
-                    if video_dir not in all_directories:
-                        all_directories.append(video_dir)
-
-            all_directories.sort()
+                if is_stream(video_path):
+                    all_video_to_dir[video_path] = "STREAMS"
+                elif video_path in on_disk:
+                    all_video_to_dir[video_path] = on_disk[video_path]
+
+            all_directories = sorted(set(all_video_to_dir.values()))
             valid_videos = list(all_video_to_dir.keys())
 
             if not valid_videos:
                 messagebox.showwarning("Warning", "No valid videos found")
                 return
 
-            def start_history_player():
-                self.update_console(f"Playing {len(valid_videos)} videos from history")
-                self.controller = VLCPlayerControllerForMultipleDirectory(
-                    valid_videos, all_video_to_dir, all_directories, self.update_console,
-                    volume=self.volume, is_muted=self.is_muted
-                )
-                self.controller.set_loop_mode(self.loop_mode)
-                self.controller.set_volume_save_callback(self._save_volume_callback)
-                self.controller.set_watch_history_callback(
-                    self.watch_history_manager.track_video_playback
-                )
-                self.controller.set_resume_manager(self.resume_manager)
-
-                initial_speed = self.speed_var.get()
-                if initial_speed != 1.0:
-                    self.controller.set_initial_playback_rate(initial_speed)
-                    self.update_console(f"Initial playback speed set to {initial_speed}x")
-
-                self.controller.set_start_index(0)
-                self.controller.set_video_change_callback(self.on_video_changed)
-                self.controller.set_stop_callback(self._on_player_stopped)
-
-                if self.player_thread and self.player_thread.is_alive():
-                    self.controller.running = False
-                    self.player_thread.join(timeout=3.0)
-
-                self.player_thread = threading.Thread(target=self.controller.run, daemon=True)
-                self.player_thread.start()
-
-                self.keys_thread = threading.Thread(target=lambda: listen_keys(self.controller, self.settings_manager.get_settings().hotkeys if hasattr(self, "settings_manager") else None), daemon=True)
-                self.keys_thread.start()
-                time.sleep(1)
-                self.controller.init_overlay()
-
-            threading.Thread(target=start_history_player, daemon=True).start()
+            self.task_executor.submit(
+                self._start_controller,
+                valid_videos, all_video_to_dir, all_directories,
+                f"Playing {len(valid_videos)} videos from history"
+            )
 
         def toggle_smart_resume(self):
             enabled = bool(self.smart_resume_var.get())
@@ -4241,8 +4507,8 @@ def select_multiple_folders_and_play():
                 cache = self.scan_cache.get(selected_dir)
                 if cache:
                     videos, _, _ = cache
-                    filtered = [v for v in videos
-                                if not self.is_video_excluded(selected_dir, v)]
+                    is_excluded = self._exclusion_filter(selected_dir)
+                    filtered = [v for v in videos if not is_excluded(v)]
                     if filtered:
                         self.dual_player_manager.load_videos_into_slot(win_id, 1, filtered[:200])
                         return
@@ -4303,11 +4569,9 @@ def select_multiple_folders_and_play():
 
                 if os.path.isdir(item_path):
                     try:
-                        for root, dirs, files in os.walk(item_path):
-                            for f in files:
-                                full_path = os.path.join(root, f)
-                                if is_video(full_path) and not self.is_video_excluded(selected_dir, full_path):
-                                    collected.append(full_path)
+                        # Excluded subtrees are skipped by the scan, not filtered after it.
+                        videos = gather_videos(item_path, list(self.excluded_subdirs.get(selected_dir, ())))
+                        collected.extend(v for v in videos if not self.is_video_excluded(selected_dir, v))
                     except Exception as e:
                         self.update_console(f"Error reading folder {item_path}: {e}")
 
@@ -4571,7 +4835,7 @@ def select_multiple_folders_and_play():
                         folder_id = source["id"]
                         pseudo_dir = f"gdrive://folder/{folder_id}"
                         # Duplicate check on UI thread state snapshot
-                        if pseudo_dir in self.selected_dirs:
+                        if pseudo_dir in self._selected_set:
                             self.root.after(0, lambda: (set_status("Drive link already added."), finish_cleanup()))
                             return
                         self.root.after(0, lambda: set_status("Listing folder recursively…"))
@@ -4581,6 +4845,7 @@ def select_multiple_folders_and_play():
                         def apply_folder():
                             self.scan_cache.set(pseudo_dir, (videos, video_to_dir, directories))
                             self.selected_dirs.append(pseudo_dir)
+                            self._selected_set.add(pseudo_dir)
                             display_name = f"Drive Folder {folder_id}"
                             self.dir_listbox.insert(tk.END, display_name)
                             self.update_console(
@@ -4593,7 +4858,7 @@ def select_multiple_folders_and_play():
                     else:
                         file_id = source["id"]
                         pseudo_dir = f"gdrive://file/{file_id}"
-                        if pseudo_dir in self.selected_dirs:
+                        if pseudo_dir in self._selected_set:
                             self.root.after(0, lambda: (set_status("Drive link already added."), finish_cleanup()))
                             return
                         self.root.after(0, lambda: set_status("Preparing file stream…"))
@@ -4603,6 +4868,7 @@ def select_multiple_folders_and_play():
                         def apply_file():
                             self.scan_cache.set(pseudo_dir, (videos, video_to_dir, directories))
                             self.selected_dirs.append(pseudo_dir)
+                            self._selected_set.add(pseudo_dir)
                             display_name = f"Drive File {file_id}"
                             self.dir_listbox.insert(tk.END, display_name)
                             self.update_console(f"Added Google Drive file for streaming: {file_id}")
@@ -4859,6 +5125,7 @@ def select_multiple_folders_and_play():
                         self.selected_dir_label.config(
                             text=f"AI Search: '{query}' - {len(final_results)} results (score >= {min_score})")
 
+                        display_names = []
                         for idx, result in enumerate(final_results):
                             try:
                                 video_path = result['video_path']
@@ -4869,9 +5136,9 @@ def select_multiple_folders_and_play():
 
                             score = result.get('score', 0)
                             frame_count = result.get('frame_count', 0)
-                            display_name = f"▶ {rel_path} (score: {score:.3f}, frames: {frame_count})"
-                            self.exclusion_listbox.insert(tk.END, display_name)
+                            display_names.append(f"▶ {rel_path} (score: {score:.3f}, frames: {frame_count})")
                             self.current_subdirs_mapping[idx] = video_path
+                        self.exclusion_listbox.insert(tk.END, *display_names)
 
                         self.update_console(f"Found {len(final_results)} videos with score >= {min_score}")
                         self.video_preview_manager.attach_to_listbox(
@@ -4943,9 +5210,16 @@ def select_multiple_folders_and_play():
 
                 self.controller.stop()
             # cleanup_hotkeys()
+            try:
+                self._persist_scans()
+            except Exception:
+                pass
             try:
                 if hasattr(self, 'executor'):
+                    self._scan_cancel.set()
                     self.executor.shutdown(wait=False, cancel_futures=True)
+                if hasattr(self, 'task_executor'):
+                    self.task_executor.shutdown(wait=False, cancel_futures=True)
             except Exception:
                 pass
             try:
@@ -1,8 +1,11 @@
+import ast
 import subprocess
 import sys
 import os
-import shutil
 import datetime
+import hashlib
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
 
 
 def get_git_version():
@@ -25,6 +28,155 @@ def get_git_commit():
         return "unknown"
 
 
+# PyInstaller only adds an extension on Windows; elsewhere the onedir
+# executable is the bare name.
+EXE_NAME = 'RecursiveVideoPlayer' + ('.exe' if os.name == 'nt' else '')
+EXE_PATH = os.path.join('dist', 'RecursiveVideoPlayer', EXE_NAME)
+SPEC_FILE = 'video_player.spec'
+STAMP_FILE = os.path.join('build', '.srcstamp')
+# version.py is rewritten on every run, so it must not count as a source change.
+STAMP_SKIP_FILES = {'version.py'}
+STAMP_SKIP_DIRS = {'build', 'dist', '__pycache__', 'venv'}
+
+
+def iter_source_files(directory='.', suffix='.py'):
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            if not entry.name.startswith('.') and entry.name not in STAMP_SKIP_DIRS:
+                yield from iter_source_files(entry.path, suffix)
+        elif entry.name.endswith(suffix) and entry.name not in STAMP_SKIP_FILES:
+            yield entry.path
+
+
+def spec_inputs(spec_path=SPEC_FILE):
+    # Source paths of the spec's datas and binaries entries. They are copied
+    # into the bundle as they are, whatever their type, so they are hashed
+    # too and not just the Python files.
+    with open(spec_path) as f:
+        tree = ast.parse(f.read(), spec_path)
+    sources = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, 'id', None) == 'Analysis':
+            for keyword in node.keywords:
+                if keyword.arg in ('datas', 'binaries'):
+                    sources.extend(src for src, _ in ast.literal_eval(keyword.value))
+    return sources
+
+
+def file_digest(path, chunk_size=1 << 20):
+    h = hashlib.blake2b(digest_size=16)
+    buf = memoryview(bytearray(chunk_size))
+    with open(path, 'rb', buffering=0) as f:
+        while n := f.readinto(buf):
+            h.update(buf[:n])
+    return h.digest()
+
+
+def source_stamp(version):
+    # The git version is baked into the exe, so a new commit gets a clean
+    # build even when no hashed file changed.
+    h = hashlib.blake2b(version.encode())
+    paths = [SPEC_FILE, *iter_source_files()]
+    for src in spec_inputs():
+        if os.path.isdir(src):
+            paths.extend(iter_source_files(src, suffix=''))
+        elif os.path.exists(src):
+            paths.append(src)
+    # Data folders overlap the Python sources; hash each file once.
+    paths = list(dict.fromkeys(os.path.normpath(path) for path in paths))
+    # Files are read and digested on a pool (hashlib releases the GIL on
+    # large buffers); combining the digests in path order keeps it stable.
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for path, digest in zip(paths, pool.map(file_digest, paths)):
+            h.update(path.encode())
+            h.update(digest)
+    return h.hexdigest()
+
+
+def read_stamp():
+    try:
+        with open(STAMP_FILE) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def write_stamp(stamp):
+    os.makedirs(os.path.dirname(STAMP_FILE), exist_ok=True)
+    with open(STAMP_FILE, 'w') as f:
+        f.write(stamp)
+
+
+def fast_rmtree(path):
+    # Iterative scandir walk: DirEntry already knows each entry's type, so
+    # nothing is stat'ed twice. Directories are removed deepest first, i.e.
+    # in the reverse of the order they were found.
+    dirs = [path]
+    stack = [path]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    dirs.append(entry.path)
+                else:
+                    os.unlink(entry.path)
+    for dir_path in reversed(dirs):
+        os.rmdir(dir_path)
+
+
+def remove_tree(path):
+    # The OS's own recursive delete skips the per-entry Python overhead; the
+    # scandir walk is the fallback when it is missing or leaves files behind.
+    cmd = ['cmd', '/c', 'rmdir', '/S', '/Q', path] if os.name == 'nt' else ['rm', '-rf', path]
+    try:
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+    except OSError:
+        pass
+    if os.path.exists(path):
+        fast_rmtree(path)
+
+
+def clean_dirs(dir_names):
+    existing = [d for d in dir_names if os.path.exists(d)]
+    if not existing:
+        return
+    # Each tree is removed on its own thread; unlink and rmdir release the
+    # GIL, so a large build/ no longer holds up dist/ and __pycache__/.
+    with ThreadPoolExecutor(max_workers=len(existing)) as pool:
+        for dir_name, _ in zip(existing, pool.map(remove_tree, existing)):
+            print(f"  Removed: {dir_name}")
+
+
+def ram_workpath():
+    # On Linux PyInstaller's intermediate files go to the /dev/shm tmpfs
+    # instead of build/. The path is fixed so that a build with unchanged
+    # inputs finds the previous run's cache there; it is wiped along with
+    # build/ whenever a clean build runs, and is gone after a reboot. This is
+    # Linux-only: Windows and macOS have no RAM-backed temp directory by
+    # default, so they return None and keep build/.
+    if sys.platform.startswith('linux') and os.path.isdir('/dev/shm'):
+        return os.path.join('/dev/shm', 'rvp-build')
+    return None
+
+
+def pyinstaller_installed():
+    return importlib.util.find_spec("PyInstaller") is not None
+
+
+def ensure_pyinstaller():
+    # Spawning pip costs an interpreter start and an index lookup; skip it
+    # when PyInstaller is already importable.
+    if pyinstaller_installed():
+        print("  PyInstaller already installed")
+    else:
+        subprocess.run([sys.executable, '-m', 'pip', 'install', '--disable-pip-version-check',
+                        '--no-input', 'pyinstaller'], check=True)
+        importlib.invalidate_caches()
+
+
 def write_version_file():
     version = get_git_version()
     commit  = get_git_commit()
@@ -48,19 +200,49 @@ def main():
     print(f"  commit  : {commit}")
     print(f"  date    : {build}")
 
-    print("\n[2/6] Cleaning previous builds...")
-    dirs_to_clean = ['build', 'dist', '__pycache__']
-    for dir_name in dirs_to_clean:
-        if os.path.exists(dir_name):
-            shutil.rmtree(dir_name)
-            print(f"  Removed: {dir_name}")
+    exe_location = os.path.abspath(EXE_PATH)
+    stamp = source_stamp(version)
+    # The stamp only decides whether the previous output can stay: PyInstaller
+    # always runs, but with unchanged inputs it reuses the previous workpath
+    # (build/, or the tmpfs directory on Linux) instead of starting from an
+    # empty tree.
+    keep_previous = '--force' not in sys.argv[1:] and read_stamp() == stamp and os.path.exists(EXE_PATH)
+    workpath = ram_workpath()
 
-    subprocess.run([sys.executable, '-m', 'pip', 'install', 'pyinstaller'], check=True)
+    print("\n[2/6] Cleaning previous builds...")
+    if keep_previous:
+        print("  Inputs unchanged since the last build; keeping it (pass --force to clean)")
+    print("\n[3/6] Checking PyInstaller...")
+    # The clean and a possible pip install don't depend on each other, so the
+    # clean runs in the background; result() re-raises any error it hit.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        stale = ['build', 'dist', '__pycache__'] + ([workpath] if workpath else [])
+        cleaning = None if keep_previous else pool.submit(clean_dirs, stale)
+        ensure_pyinstaller()
+        if cleaning is not None:
+            cleaning.result()
 
     print("\n[5/6] Building with PyInstaller...")
-    subprocess.run([sys.executable, '-m', 'PyInstaller', 'video_player.spec', '--clean'], check=True)
+    # Run in this interpreter rather than a fresh one; a failed build still
+    # aborts the script through the SystemExit PyInstaller raises.
+    import PyInstaller.__main__
+    # --noconfirm lets PyInstaller replace a kept dist/ without prompting.
+    args = [SPEC_FILE, '--noconfirm']
+    if not keep_previous:
+        args.append('--clean')
+    if workpath:
+        args += ['--workpath', workpath]
+    try:
+        PyInstaller.__main__.run(args)
+    except BaseException:
+        # A failed build must not leave a half-written cache in RAM for the
+        # next run to reuse; a successful one keeps it.
+        if workpath:
+            remove_tree(workpath)
+        raise
 
     print("\n[6/6] Post-build cleanup...")
+    write_stamp(stamp)
 
     print("\n" + "=" * 60)
     print("Build Complete!")
@@ -68,7 +250,7 @@ def main():
     print(f"\n  Version    : {version}")
     print(f"  Commit     : {commit}")
     print(f"  Build date : {build}")
-    print(f"\nExecutable location: {os.path.abspath('dist/RecursiveVideoPlayer/RecursiveVideoPlayer.exe')}")
+    print(f"\nExecutable location: {exe_location}")
     print("\nNOTE: Before distributing, ensure:")
     print("  1. VLC is installed on target system")
     print("  3. Test all features thoroughly")
@@ -32,12 +32,23 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Callable
 
-import vlc
 try:
     from screeninfo import get_monitors as _get_monitors
 except Exception:
     _get_monitors = None
 
+vlc = None
+
+
+def _load_vlc():
+    # python-vlc loads libvlc as soon as it is imported, so the import waits
+    # until the first player is built; later methods use the module global.
+    global vlc
+    if vlc is None:
+        import vlc as module
+        vlc = module
+    return vlc
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Tiny helpers
@@ -158,6 +169,7 @@ class EmbeddedPlayer:
         self._sleep_remaining = 0      # seconds remaining
 
         # VLC
+        _load_vlc()
         self._instance = vlc.Instance("--no-video-title-show", "--quiet")
         self._player   = self._instance.media_player_new()
         self._player.audio_set_mute(self.is_muted)
@@ -5,10 +5,21 @@ import threading
 import tkinter as tk
 from tkinter.font import Font
 from typing import Optional, Callable, List
-import vlc
 
+vlc = None
 
-def _embed(player: vlc.MediaPlayer, canvas: tk.Canvas):
+
+def _load_vlc():
+    # python-vlc loads libvlc as soon as it is imported, so the import waits
+    # until the first player is built; later methods use the module global.
+    global vlc
+    if vlc is None:
+        import vlc as module
+        vlc = module
+    return vlc
+
+
+def _embed(player: 'vlc.MediaPlayer', canvas: tk.Canvas):
     """Attach a VLC MediaPlayer to a tk Canvas."""
     canvas.update_idletasks()
     wid = canvas.winfo_id()
@@ -493,6 +504,7 @@ class DualPlayerSlot:
                 pass
 
     def _make_vlc_instance(self):
+        _load_vlc()
         try:
             args = ['--quiet', '--no-video-title-show']
             if os.name == 'nt':
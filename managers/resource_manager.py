@@ -355,6 +355,10 @@ class ThreadSafeDict:
             if key in self._dict:
                 del self._dict[key]
 
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._dict.pop(key, default)
+
     def clear(self):
         with self._lock:
             self._dict.clear()
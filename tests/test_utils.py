@@ -0,0 +1,89 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import build_path_trie, gather_videos, gather_videos_with_directories, list_subtree, list_tree_entries
+
+
+def _touch(path):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, 'w').close()
+
+
+class ListTreeEntriesTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        list_tree_entries.cache_clear()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), "symlinks not supported")
+    def test_symlink_loop_is_not_followed(self):
+        _touch(os.path.join(self.root, 'a', 'clip.mp4'))
+        try:
+            os.symlink(self.root, os.path.join(self.root, 'a', 'loop'), target_is_directory=True)
+        except OSError:
+            self.skipTest("cannot create symlinks here")
+
+        self.assertEqual(list_tree_entries(os.path.join(self.root, 'a')),
+                         (('clip.mp4', os.path.join(self.root, 'a', 'clip.mp4'), False),))
+
+        # The tree and the playlist agree: the video is found once.
+        videos, _, _ = gather_videos_with_directories(self.root)
+        self.assertEqual(videos, [os.path.join(self.root, 'a', 'clip.mp4')])
+
+
+class ListSubtreeTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        for rel in ('keep/a.mp4', 'skip/b.mp4', 'skip/inner/c.mp4'):
+            _touch(os.path.join(self.root, *rel.split('/')))
+        self.trie = build_path_trie([os.path.join(self.root, 'skip')])
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_excluded_subtree_is_pruned(self):
+        subdirs, videos = list_subtree(self.root, self.trie)
+        self.assertEqual(subdirs, [os.path.join(self.root, 'keep')])
+        self.assertEqual(videos, [os.path.join(self.root, 'keep', 'a.mp4')])
+
+    def test_keep_excluded_lists_the_folder_without_entering_it(self):
+        subdirs, videos = list_subtree(self.root, self.trie, keep_excluded=True)
+        self.assertEqual(sorted(subdirs), [os.path.join(self.root, 'keep'), os.path.join(self.root, 'skip')])
+        self.assertEqual(videos, [os.path.join(self.root, 'keep', 'a.mp4')])
+
+    def test_excluded_start_returns_nothing(self):
+        self.assertEqual(list_subtree(os.path.join(self.root, 'skip'), self.trie), ([], []))
+
+
+class GatherVideosTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        for rel in ('keep/a.mp4', 'keep/deeper/d.mkv', 'skip/b.mp4', 'skip/inner/c.mp4'):
+            _touch(os.path.join(self.root, *rel.split('/')))
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_excluded_subtrees_are_skipped(self):
+        videos, video_to_dir, directories = gather_videos_with_directories(
+            self.root, [os.path.join(self.root, 'skip')])
+        keep = os.path.join(self.root, 'keep')
+        self.assertEqual(videos, [os.path.join(keep, 'a.mp4'), os.path.join(keep, 'deeper', 'd.mkv')])
+        self.assertEqual(directories, [keep, os.path.join(keep, 'deeper')])
+        self.assertEqual(video_to_dir[os.path.join(keep, 'a.mp4')], keep)
+
+    def test_excluded_root_yields_nothing(self):
+        self.assertEqual(gather_videos(os.path.join(self.root, 'skip'), [os.path.join(self.root, 'skip')]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -107,6 +107,37 @@ class ConfigHandler:
                 'excluded_subdirs': {}, 'excluded_videos': {}, 'smart_resume_enabled':False, 'volume':50,
                 'is_muted': False, 'loop_mode':'loop_on', 'show_console': True}
 
+    @property
+    def scan_cache_path(self):
+        _, local_dir = _get_app_dirs()
+        return local_dir / "Cache" / "scan_cache.json"
+
+    def load_scan_cache(self):
+        path = self.scan_cache_path
+        try:
+            if path.exists():
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+        except Exception:
+            pass
+        return {}
+
+    def save_scan_cache(self, entries):
+        path = self.scan_cache_path
+        tmp = path.with_suffix(".tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(entries, f)
+            tmp.replace(path)
+        except Exception:
+            try:
+                tmp.unlink(missing_ok=True)
+            except Exception:
+                pass
+
     def save(self, config_dict):
         try:
             encoded_dirs = [base64.b64encode(d.encode()).decode() for d in config_dict.get('selected_dirs', [])]
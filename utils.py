@@ -1,40 +1,222 @@
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import repeat
 
 VIDEO_SUFFIXES = ('.mp4', '.mkv', '.avi', '.mov', '.wmv', '.flv')
+# Bare extensions for set lookups; only the suffix is lowercased, not the whole name.
+VIDEO_EXTS = frozenset(suffix[1:] for suffix in VIDEO_SUFFIXES)
+SCAN_THREADS = 8
+# Folders that never hold a user's videos; a scan started at a drive root or
+# home folder would otherwise descend through all of them.
+SKIP_DIR_NAMES = frozenset({
+    '$RECYCLE.BIN', 'System Volume Information', 'node_modules', '__pycache__',
+})
+
+
+# Number of per-scan cancel flags shared with the scan pool; scans started
+# while every slot is taken can still be stopped by closing the app.
+SCAN_CANCEL_SLOTS = 64
+
+# Set by init_scan_worker, in each worker of a process pool or once for a
+# thread pool, and checked once per directory: _scan_cancel stops every walk when the app closes, and a scan's
+# byte in _scan_cancel_slots stops just that walk when its folder is removed.
+_scan_cancel = None
+_scan_cancel_slots = None
+
+
+class ScanCancelled(Exception):
+    pass
+
+
+def init_scan_worker(cancel_event, cancel_slots=None):
+    global _scan_cancel, _scan_cancel_slots
+    _scan_cancel = cancel_event
+    _scan_cancel_slots = cancel_slots
+
+
+def _scan_cancelled(cancel_slot):
+    if _scan_cancel is not None and _scan_cancel.is_set():
+        return True
+    return cancel_slot is not None and _scan_cancel_slots is not None and bool(_scan_cancel_slots[cancel_slot])
+
+
+def is_skipped_dir(name):
+    """True for hidden and system folders that scans and the tree never enter."""
+    return name.startswith('.') or name in SKIP_DIR_NAMES
 
 
 def is_video(file_name: str) -> bool:
-    return file_name.lower().endswith(VIDEO_SUFFIXES)
+    _, dot, ext = file_name.rpartition('.')
+    return bool(dot) and ext.lower() in VIDEO_EXTS
+
+
+def existing_files(paths):
+    # Group by parent so each directory is listed once with scandir instead
+    # of issuing a separate stat() for every file.
+    by_dir = defaultdict(list)
+    for path in paths:
+        parent, name = os.path.split(path)
+        by_dir[parent].append((path, os.path.normcase(name)))
+
+    # Maps each existing path to its parent, which callers need anyway, so
+    # they don't have to call dirname() again per file.
+    existing = {}
+    for parent, entries in by_dir.items():
+        try:
+            with os.scandir(parent or os.curdir) as it:
+                names = {os.path.normcase(entry.name) for entry in it if entry.is_file()}
+        except (PermissionError, OSError):
+            continue
+        existing.update((path, parent) for path, name in entries if name in names)
+    return existing
+
+
+def build_path_trie(paths):
+    """Nested-dict trie of normalised path components; a None key marks where a stored path ends."""
+    trie = {}
+    for path in paths:
+        node = trie
+        for part in os.path.normpath(path).split(os.sep):
+            node = node.setdefault(part, {})
+        node[None] = True
+    return trie
+
+
+def path_in_trie(trie, path):
+    """True if path is, or lies below, one of the paths stored in trie."""
+    node = trie
+    for part in os.path.normpath(path).split(os.sep):
+        node = node.get(part)
+        if node is None:
+            return False
+        if None in node:
+            return True
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _list_tree_entries(directory, mtime_ns):
+    # mtime_ns is only part of the cache key: adding, removing or renaming a
+    # direct child bumps it, so a stale listing is never served.
+    with os.scandir(directory) as it:
+        entries = sorted(it, key=lambda entry: entry.name)
+    listing = []
+    for entry in entries:
+        # Links are not followed, as in _scan_level, so the tree shows what the
+        # playlist holds and a link back to an ancestor cannot repeat rows.
+        try:
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir:
+                if not is_skipped_dir(entry.name):
+                    listing.append((entry.name, entry.path, True))
+            elif is_video(entry.name) and entry.is_file():
+                listing.append((entry.name, entry.path, False))
+        except OSError:
+            continue
+    return tuple(listing)
 
 
-def gather_videos_with_directories(directory):
+def list_tree_entries(directory):
+    """Sorted (name, path, is_dir) tuples for the subdirectories and videos directly in directory."""
+    try:
+        return _list_tree_entries(directory, os.stat(directory).st_mtime_ns)
+    except OSError:
+        return ()
+
+
+list_tree_entries.cache_clear = _list_tree_entries.cache_clear
+
+
+def _scan_level(dir_path, excluded_trie):
+    # One scandir per directory: DirEntry already knows the entry type, so
+    # nothing is stat'ed or listed a second time.
+    subdirs = []
+    dir_videos = []
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if is_skipped_dir(entry.name):
+                            continue
+                        if not (excluded_trie and path_in_trie(excluded_trie, entry.path)):
+                            subdirs.append(entry.path)
+                    elif is_video(entry.name) and entry.is_file():
+                        dir_videos.append(entry.path)
+                except (PermissionError, OSError):
+                    continue
+    except (PermissionError, OSError):
+        pass
+    return subdirs, dir_videos
+
+
+def _scan_subtree(top, excluded_trie, cancel_slot=None):
+    found = {}
+    stack = [top]
+    while stack:
+        if _scan_cancelled(cancel_slot):
+            raise ScanCancelled(top)
+        dir_path = stack.pop()
+        subdirs, dir_videos = _scan_level(dir_path, excluded_trie)
+        stack.extend(subdirs)
+        if dir_videos:
+            found[dir_path] = dir_videos
+    return found
+
+
+def list_subtree(directory, excluded_trie=None, keep_excluded=False):
+    """Every subdirectory and video below directory, as two lists of full paths.
+
+    Subtrees in excluded_trie are never entered. With keep_excluded, the top
+    folder of each pruned subtree is still returned, for callers that need
+    the excluded folders' names but nothing inside them.
+    """
+    subdirs = []
+    videos = []
+    if excluded_trie and path_in_trie(excluded_trie, directory):
+        return subdirs, videos
+    stack = [directory]
+    while stack:
+        level_dirs, level_videos = _scan_level(stack.pop(), None if keep_excluded else excluded_trie)
+        subdirs.extend(level_dirs)
+        if keep_excluded and excluded_trie:
+            level_dirs = [d for d in level_dirs if not path_in_trie(excluded_trie, d)]
+        videos.extend(level_videos)
+        stack.extend(level_dirs)
+    return subdirs, videos
+
+
+def gather_videos_with_directories(directory, excluded=None, cancel_slot=None):
+    # Only touches its own locals, so concurrent calls from the scan pool need
+    # no locking, with or without the GIL.
     videos = []
     video_to_dir = {}
     directories = []
 
+    # Excluded subtrees are pruned during the walk, so they are never listed.
+    excluded_trie = build_path_trie(excluded) if excluded else None
+    if excluded_trie and path_in_trie(excluded_trie, directory):
+        return videos, video_to_dir, directories
+
     try:
-        for root, dirs, files in os.walk(directory):
-            try:
-                if any(is_video(file) for file in files):
-                    directories.append(root)
-            except (PermissionError, OSError):
-                continue
+        subdirs, root_videos = _scan_level(directory, excluded_trie)
+        found = {directory: root_videos} if root_videos else {}
 
-        directories.sort()
+        # scandir releases the GIL while it waits on the filesystem, so the
+        # top-level subtrees of one root are walked on threads side by side.
+        if len(subdirs) > 1:
+            with ThreadPoolExecutor(max_workers=min(SCAN_THREADS, len(subdirs))) as pool:
+                for part in pool.map(_scan_subtree, subdirs, repeat(excluded_trie), repeat(cancel_slot)):
+                    found.update(part)
+        elif subdirs:
+            found.update(_scan_subtree(subdirs[0], excluded_trie, cancel_slot))
 
-        for dir_path in directories:
-            dir_videos = []
-            try:
-                with os.scandir(dir_path) as it:
-                    for entry in it:
-                        try:
-                            if entry.is_file() and is_video(entry.name):
-                                dir_videos.append(entry.path)
-                        except (PermissionError, OSError):
-                            continue
-            except (PermissionError, OSError):
-                continue
+        directories = sorted(found)
 
+        for dir_path in directories:
+            dir_videos = found[dir_path]
             dir_videos.sort()
 
             for video in dir_videos:
@@ -43,11 +225,13 @@ def gather_videos_with_directories(directory):
 
         return videos, video_to_dir, directories
 
+    except ScanCancelled:
+        raise
     except Exception as e:
         print(f"Error gathering videos: {e}")
         return [], {}, []
 
 
-def gather_videos(directory):
-    videos, _, _ = gather_videos_with_directories(directory)
+def gather_videos(directory, excluded=None):
+    videos, _, _ = gather_videos_with_directories(directory, excluded)
     return videos
@@ -251,6 +251,11 @@ class BaseVLCPlayerController:
                 except Exception:
                     pass
 
+    @property
+    def is_cleaned_up(self):
+        """True once stop() has run; the controller cannot be played again."""
+        return self._is_cleanup
+
     def stop(self):
         with self._cleanup_lock:
             if self._is_cleanup:
@@ -1077,6 +1082,23 @@ class VLCPlayerControllerForMultipleDirectory(BaseVLCPlayerController):
                 self.logger(f"Video not found in playlist: {os.path.basename(video_path)}")
             return False
 
+    def replace_queue(self, videos, video_to_dir, directories, start_index=0):
+        """Swap in a new video list and start playing it in the existing VLC player.
+
+        Called from a task-executor thread while the player thread keeps running;
+        self.lock keeps the swap atomic with respect to that thread.
+        """
+        if not videos:
+            return False
+        with self.lock:
+            self.videos = videos
+            self.video_to_dir = video_to_dir
+            self.directories = directories
+            self.original_video_order = videos.copy()
+            self.played_indices = set()
+            self.start_index = max(0, min(start_index, len(videos) - 1))
+        return self.play_video(self.start_index)
+
     def cleanup(self):
         self.stop_position_tracking()
 